@@ -4,9 +4,11 @@ ai.py - Two-layer AI classification.
   Layer 2: Regex pattern matching (ultimate fallback)
 No cloud APIs, no rate limit costs, runs fully offline.
 """
-import re
+import hashlib
 import logging
+import sqlite3
 import numpy as np
+from contextlib import closing
 from typing import List, Dict, Tuple, Optional
 
 import config
@@ -16,14 +18,81 @@ log = logging.getLogger(__name__)
 
 # ── Layer 1: Local Embeddings ─────────────────────────
 
+class _EmbeddingCache:
+    """
+    Persistent text → vector cache (SQLite, raw float32 blobs).
+    RSS feeds overlap run to run, so most articles skip the transformer.
+    Keyed by (model, blake2b(text)) — fallback models never mix dims.
+    """
+
+    _CHUNK = 500   # stay well under SQLite's bound-variable limit
+
+    def __init__(self, path):
+        self._path = str(path)
+        try:
+            with closing(sqlite3.connect(self._path)) as con, con:
+                con.execute(
+                    "CREATE TABLE IF NOT EXISTS emb_cache ("
+                    " model TEXT NOT NULL, key TEXT NOT NULL, vec BLOB NOT NULL,"
+                    " PRIMARY KEY (model, key))"
+                )
+            self._ok = True
+        except Exception as e:
+            log.warning(f"⚠️  Embedding cache disabled: {e}")
+            self._ok = False
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def get_many(self, model: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        if not self._ok or not keys:
+            return found
+        try:
+            with closing(sqlite3.connect(self._path)) as con:
+                for s in range(0, len(keys), self._CHUNK):
+                    chunk = keys[s:s + self._CHUNK]
+                    rows = con.execute(
+                        f"SELECT key, vec FROM emb_cache WHERE model=? "
+                        f"AND key IN ({','.join('?' * len(chunk))})",
+                        [model] + chunk,
+                    ).fetchall()
+                    for k, blob in rows:
+                        found[k] = np.frombuffer(blob, dtype=np.float32)
+        except Exception as e:
+            log.debug(f"Embedding cache read skipped: {e}")
+        return found
+
+    def put_many(self, model: str, keys: List[str], vecs: np.ndarray):
+        if not self._ok or not keys:
+            return
+        try:
+            with closing(sqlite3.connect(self._path)) as con, con:
+                con.executemany(
+                    "INSERT OR REPLACE INTO emb_cache (model, key, vec) VALUES (?,?,?)",
+                    [(model, k, np.ascontiguousarray(v, dtype=np.float32).tobytes())
+                     for k, v in zip(keys, vecs)],
+                )
+        except Exception as e:
+            log.debug(f"Embedding cache write skipped: {e}")
+
+
 class LocalEmbedding:
     """SentenceTransformer wrapper with lazy model loading."""
 
     def __init__(self):
         self._model = None
         self._model_name = None
+        self.last_model: Optional[str] = None   # model behind the last encode()
         self._available = False
+        self._CT2 = None
+        self._cache = None
         self._check_available()
+        # Regex-only mode never encodes — don't create the cache file
+        cache_path = config.LOCAL_AI_CONFIG.get("embedding_cache")
+        if self._available and cache_path:
+            self._cache = _EmbeddingCache(cache_path)
 
     def _check_available(self):
         try:
@@ -33,15 +102,39 @@ class LocalEmbedding:
             log.info("✅ SentenceTransformers available")
         except ImportError:
             log.warning("⚠️  sentence-transformers not installed → regex-only mode")
+            return
+        # Optional: int8-quantized CTranslate2 backend (same encode() API)
+        if config.LOCAL_AI_CONFIG.get("use_ct2", True):
+            try:
+                from hf_hub_ctranslate2 import CT2SentenceTransformer  # noqa
+                self._CT2 = CT2SentenceTransformer
+                log.info("✅ CTranslate2 available → int8 encoder")
+            except ImportError:
+                log.debug("hf-hub-ctranslate2 not installed → FP32 SentenceTransformer")
 
     def _load(self, model_name: str):
         if self._model_name != model_name or self._model is None:
             log.info(f"📥 Loading model: {model_name} ...")
-            self._model = self._ST(model_name)
+            self._model = self._load_ct2(model_name) or self._ST(model_name)
             self._model_name = model_name
             log.info(f"✅ Model loaded: {model_name}")
 
-    def encode(self, texts: List[str]) -> Optional[List[List[float]]]:
+    def _load_ct2(self, model_name: str):
+        """int8 CTranslate2 model, or None to fall back to plain SentenceTransformer."""
+        if self._CT2 is None:
+            return None
+        device = config.LOCAL_AI_CONFIG.get("device", "cpu")
+        try:
+            return self._CT2(
+                model_name,
+                compute_type="int8" if device == "cpu" else "int8_float16",
+                device=device,
+            )
+        except Exception as e:
+            log.warning(f"⚠️  CTranslate2 load failed for {model_name}: {e} — using FP32")
+            return None
+
+    def encode(self, texts: List[str]) -> Optional[np.ndarray]:
         if not self._available or not texts:
             return None
         cfg = config.LOCAL_AI_CONFIG
@@ -50,20 +143,74 @@ class LocalEmbedding:
             if not model:
                 continue
             try:
-                self._load(model)
-                vecs = self._model.encode(
-                    texts,
-                    batch_size=cfg["batch_size"],
-                    show_progress_bar=cfg["show_progress"],
-                    convert_to_numpy=True,
-                    normalize_embeddings=True,  # Pre-normalize → faster cosine
-                )
-                log.info(f"✅ Embedded {len(vecs)} texts via {model}")
-                return vecs.tolist()
+                out = self._encode_cached(model, texts)
+                self.last_model = model
+                return out
             except Exception as e:
                 log.warning(f"⚠️  Model {model} failed: {e}")
         return None
 
+    def _encode_cached(self, model: str, texts: List[str]) -> np.ndarray:
+        """Serve cache hits, encode only the misses, write them back."""
+        if self._cache is None:
+            return self._encode_with(model, texts)
+
+        keys  = [_EmbeddingCache.key(t) for t in texts]
+        hits  = self._cache.get_many(model, keys)
+        miss  = [i for i, k in enumerate(keys) if k not in hits]
+        fresh = self._encode_with(model, [texts[i] for i in miss]) if miss else None
+
+        dim = fresh.shape[1] if fresh is not None else len(next(iter(hits.values())))
+        out = np.empty((len(texts), dim), dtype=np.float32)
+        for i, k in enumerate(keys):
+            if k in hits:
+                out[i] = hits[k]
+        if fresh is not None:
+            out[miss] = fresh
+            self._cache.put_many(model, [keys[i] for i in miss], fresh)
+        log.info(f"✅ Embeddings: {len(texts) - len(miss)} cached, {len(miss)} encoded")
+        return out
+
+    def _encode_with(self, model: str, texts: List[str]) -> np.ndarray:
+        cfg = config.LOCAL_AI_CONFIG
+        self._load(model)
+        buckets = self._buckets(texts)
+        out = None
+        for idxs, batch_size in buckets:
+            vecs = self._model.encode(
+                [texts[i] for i in idxs],
+                batch_size=batch_size,
+                show_progress_bar=cfg["show_progress"],
+                convert_to_numpy=True,
+                normalize_embeddings=True,  # Pre-normalize → faster cosine
+            )
+            if out is None:
+                out = np.empty((len(texts), vecs.shape[1]), dtype=np.float32)
+            out[idxs] = vecs   # unshuffle back to caller's order
+        log.info(f"✅ Embedded {len(out)} texts via {model} "
+                 f"({len(buckets)} length bucket(s))")
+        return out
+
+    @staticmethod
+    def _buckets(texts: List[str]) -> List[Tuple[List[int], int]]:
+        """
+        Group text indices into word-count buckets, length-sorted within each,
+        so short titles never pad up to long summaries in the same batch.
+        Returns [(indices, batch_size), ...] for non-empty buckets.
+        """
+        cfg    = config.LOCAL_AI_CONFIG
+        bounds = cfg.get("length_buckets") or [(None, cfg["batch_size"])]
+        groups: List[List[int]] = [[] for _ in bounds]
+        for i in sorted(range(len(texts)), key=lambda i: len(texts[i])):
+            words = len(texts[i].split())
+            for b, (max_words, _) in enumerate(bounds):
+                if max_words is None or words <= max_words:
+                    groups[b].append(i)
+                    break
+            else:
+                groups[-1].append(i)
+        return [(g, bounds[b][1]) for b, g in enumerate(groups) if g]
+
     @property
     def available(self) -> bool:
         return self._available
@@ -72,35 +219,259 @@ class LocalEmbedding:
 # ── Layer 2: Regex Classifier ─────────────────────────
 
 class RegexClassifier:
-    """Fallback classifier. Pre-compiles all patterns at startup."""
+    """
+    Fallback classifier. Uses config's one-alternation-per-category regexes,
+    so each category is a single C-level scan per text. Each pattern is wrapped
+    in its own named group → distinct-pattern hits are counted via m.lastgroup.
+    Texts matching no pattern at all are rejected by one scan of the union,
+    or by an Aho–Corasick literal prefilter (pyahocorasick) if installed,
+    which also limits the regex work to categories whose literals occur.
+    Uses a Hyperscan multi-pattern DFA (all categories, one pass) if installed.
+    """
+
+    _ID_STRIDE = 1000   # hyperscan id = cat_idx * stride + pat_idx
 
     def __init__(self):
-        self._patterns = {
-            cat: [re.compile(p, re.IGNORECASE) for p in pats]
-            for cat, pats in config.REGEX_FALLBACK.items()
-        }
+        self._cats = list(config.REGEX_FALLBACK.keys())
+        self._compiled = config.REGEX_FALLBACK_COMBINED
+        self._any      = config.REGEX_FALLBACK_TAGGED
+        self._bounds = {cat: len(pats) for cat, pats in config.REGEX_FALLBACK.items()}
+        self._hs_db = self._build_hyperscan()
+        self._ac, self._always = self._build_prefilter()
+
+    def _build_prefilter(self):
+        """
+        Automaton over each pattern's required literal → categories it implies.
+        Categories with a pattern that has no usable literal are always scanned.
+        """
+        try:
+            import ahocorasick
+        except ImportError:
+            return None, frozenset()
+        owners: Dict[str, set] = {}
+        always = set()
+        for cat, lits in config.REGEX_FALLBACK_LITERALS.items():
+            for lit in lits:
+                if lit is None:
+                    always.add(cat)
+                else:
+                    owners.setdefault(lit, set()).add(cat)
+        ac = ahocorasick.Automaton()
+        for lit, cats in owners.items():
+            ac.add_word(lit, frozenset(cats))
+        ac.make_automaton()
+        return ac, frozenset(always)
+
+    def _candidates(self, text: str) -> List[str]:
+        """Categories that can possibly match text, in config order."""
+        hit = set(self._always)
+        for _, cats in self._ac.iter(text.casefold()):
+            hit |= cats
+        return [c for c in self._cats if c in hit]
+
+    def _build_hyperscan(self):
+        try:
+            import hyperscan
+        except ImportError:
+            return None
+        exprs, ids = [], []
+        for ci, cat in enumerate(self._cats):
+            for pi, p in enumerate(config.REGEX_FALLBACK[cat]):
+                exprs.append(p.pattern.encode())
+                ids.append(ci * self._ID_STRIDE + pi)
+        # SINGLEMATCH → each pattern reports once = distinct-pattern hits
+        flags  = [hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(exprs)
+        path   = config.LOCAL_AI_CONFIG.get("hs_cache_path")
+        digest = hashlib.sha256(repr((exprs, ids, flags)).encode()).digest()
+
+        # Serialized DB from an earlier run (digest prefix = same patterns)
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    blob = f.read()
+                if blob[:len(digest)] == digest:
+                    hs_db = hyperscan.loadb(blob[len(digest):], hyperscan.HS_MODE_BLOCK)
+                    hs_db.scratch = hyperscan.Scratch(hs_db)
+                    log.info(f"✅ Hyperscan DB loaded from cache ({len(exprs)} patterns)")
+                    return hs_db
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.debug(f"Hyperscan cache unusable: {e}")
+
+        try:
+            hs_db = hyperscan.Database()
+            hs_db.compile(expressions=exprs, ids=ids, flags=flags)
+            log.info(f"✅ Hyperscan DB compiled ({len(exprs)} patterns)")
+        except Exception as e:
+            log.warning(f"⚠️  Hyperscan compile failed: {e} — using re")
+            return None
+
+        if path:
+            try:
+                with open(path, "wb") as f:
+                    f.write(digest + hyperscan.dumpb(hs_db))
+            except Exception as e:
+                log.debug(f"Hyperscan cache write skipped: {e}")
+        return hs_db
+
+    def _scores(self, text: str) -> Dict[str, int]:
+        """Distinct-pattern hits per category from one Hyperscan pass."""
+        counts = np.zeros(len(self._cats), dtype=np.int32)
+
+        def on_match(pid, start, end, flags, context):
+            counts[pid // self._ID_STRIDE] += 1
+
+        self._hs_db.scan(text.encode("utf-8", "ignore"),
+                         match_event_handler=on_match)
+        return dict(zip(self._cats, counts.tolist()))
+
+    def _best_re(self, text: str, cats: List[str] = None) -> Tuple[str, int]:
+        """
+        re path with early exit. A category can score at most its pattern
+        count, so it is skipped once that bound can't beat the leader (ties
+        keep the earlier category, as max() does), and its scan stops as soon
+        as every pattern has hit.
+        """
+        cats = cats or self._cats
+        best, best_hits = cats[0], -1
+        for cat in cats:
+            bound = self._bounds[cat]
+            if bound <= best_hits:
+                continue
+            seen = set()
+            for m in self._compiled[cat].finditer(text):
+                seen.add(m.lastgroup)
+                if len(seen) == bound:
+                    break
+            if len(seen) > best_hits:
+                best, best_hits = cat, len(seen)
+        return best, best_hits
 
     def classify(self, text: str) -> Tuple[str, float]:
         """Returns (category, confidence 0-1)."""
-        scores = {
-            cat: sum(1 for p in pats if p.search(text))
-            for cat, pats in self._patterns.items()
-        }
-        best = max(scores, key=scores.get)
-        hits = scores[best]
+        if self._hs_db is not None:
+            scores = self._scores(text)
+            best = max(scores, key=scores.get)
+            hits = scores[best]
+        elif self._ac is not None:
+            cats = self._candidates(text)
+            best, hits = self._best_re(text, cats) if cats else ("GENERAL", 0)
+        elif self._any.search(text) is None:
+            hits = 0          # common case: nothing matches, one scan total
+        else:
+            best, hits = self._best_re(text)
         if hits == 0:
             return "GENERAL", 0.2
         return best, min(hits / 3.0, 1.0)
 
 
-# ── Cosine similarity (numpy) ─────────────────────────
+# ── Embedding storage ─────────────────────────────────
+
+def _storage(vecs: np.ndarray) -> np.ndarray:
+    """
+    Contiguous [N, D] buffer in LOCAL_AI_CONFIG["embedding_dtype"].
+    float16 halves RAM / cache traffic; cosine resolution is unaffected.
+    """
+    dtype = np.dtype(config.LOCAL_AI_CONFIG.get("embedding_dtype", "float32"))
+    return np.ascontiguousarray(vecs, dtype=dtype)
+
+
+# ── Optional Numba cosine kernel ──────────────────────
+
+def _has_blas() -> bool:
+    """True if numpy was built against an optimized BLAS."""
+    try:
+        cfg = getattr(np.__config__, "CONFIG", None)
+        if cfg is not None:                                    # numpy >= 1.26
+            return bool(cfg["Build Dependencies"]["blas"].get("found"))
+        return bool(getattr(np.__config__, "blas_info", None) or
+                    getattr(np.__config__, "blas_opt_info", None))
+    except Exception:
+        return True   # unknown → assume BLAS, keep the matmul path
+
+
+def _build_cosine_kernel():
+    """
+    Parallel JIT'd [N, D] x [C, D] dot-product matrix, for stripped images
+    without a good BLAS. Inputs are unit-norm, so dot == cosine.
+    Returns None if numba isn't installed or not selected.
+    """
+    if not (config.LOCAL_AI_CONFIG.get("use_numba") or not _has_blas()):
+        return None
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_matrix(E, A):
+        out = np.empty((E.shape[0], A.shape[0]), dtype=np.float32)
+        for i in prange(E.shape[0]):
+            for j in range(A.shape[0]):
+                s = 0.0
+                for k in range(E.shape[1]):
+                    s += E[i, k] * A[j, k]
+                out[i, j] = s
+        return out
+
+    # Pay JIT compile once, at import
+    _cosine_matrix(np.ones((1, 1), np.float32), np.ones((1, 1), np.float32))
+    log.info("✅ Numba cosine kernel compiled")
+    return _cosine_matrix
+
+
+_COSINE_KERNEL = _build_cosine_kernel()
+
+
+def _topk(sims: np.ndarray, k: int = 3) -> np.ndarray:
+    """
+    Row-wise top-k column indices, best first. argpartition is O(C)
+    per row; only the k survivors get sorted.
+    """
+    k = min(k, sims.shape[1])
+    if k == sims.shape[1]:
+        return np.argsort(-sims, axis=1)
+    idx     = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    ordered = np.take_along_axis(sims, idx, axis=1)
+    order   = np.argsort(-ordered, axis=1, kind="stable")
+    return np.take_along_axis(idx, order, axis=1)
+
+
+# ── Anchor vector file cache ──────────────────────────
+# Anchor descriptions are static, so their vectors are saved once
+# (np.savez) and reloaded on startup while the descriptions match.
 
-def _cosine(v1: List[float], v2: List[float]) -> float:
-    a, b = np.array(v1), np.array(v2)
-    n1, n2 = np.linalg.norm(a), np.linalg.norm(b)
-    if n1 == 0 or n2 == 0:
-        return 0.0
-    return float(np.dot(a, b) / (n1 * n2))
+def _anchor_digest(descs: List[str]) -> str:
+    return hashlib.sha256("\n".join(descs).encode()).hexdigest()
+
+
+def _load_anchor_file(descs: List[str]) -> Optional[Tuple[str, np.ndarray]]:
+    """Returns (model, vecs) if the cache matches current anchors, else None."""
+    path = config.LOCAL_AI_CONFIG.get("anchor_cache_path")
+    if not path:
+        return None
+    try:
+        with np.load(path) as f:
+            if str(f["digest"]) != _anchor_digest(descs):
+                return None
+            return str(f["model"]), f["vecs"].astype(np.float32, copy=False)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.debug(f"Anchor cache unreadable: {e}")
+        return None
+
+
+def _save_anchor_file(descs: List[str], model: Optional[str], vecs: np.ndarray):
+    path = config.LOCAL_AI_CONFIG.get("anchor_cache_path")
+    if not path or not model:
+        return
+    try:
+        np.savez(path, digest=_anchor_digest(descs), model=model,
+                 vecs=np.asarray(vecs, dtype=np.float32))
+    except Exception as e:
+        log.debug(f"Anchor cache write skipped: {e}")
 
 
 # ── Main AI Engine ────────────────────────────────────
@@ -108,45 +479,102 @@ def _cosine(v1: List[float], v2: List[float]) -> float:
 class AIEngine:
     """
     Orchestrates embedding + regex classification.
-    Pre-computes category anchor embeddings once at startup.
+    Category anchor embeddings are computed once, lazily, in the same
+    encode() call as the first article batch (one model pass, not two).
     """
 
     def __init__(self):
         self._local  = LocalEmbedding()
         self._regex  = RegexClassifier()
-        self._anchors: Dict[str, List[float]] = {}
-        self._anchor_method = "regex"
-        self._init_anchors()
-
-    def _init_anchors(self):
-        """Build anchor vector for each category description."""
-        descs      = [v["desc"] for v in config.CATEGORY_ANCHORS.values()]
-        categories = list(config.CATEGORY_ANCHORS.keys())
-
-        log.info("🧠 Computing category anchor embeddings...")
-        vecs = self._local.encode(descs)
-
-        if vecs:
-            self._anchors = dict(zip(categories, vecs))
+        self._anchors: Dict[str, np.ndarray] = {}
+        self._anchor_cats: List[str] = []
+        self._anchor_matrix: Optional[np.ndarray] = None   # [C, D]
+        self._weights: Optional[np.ndarray] = None         # [C]
+        self._anchor_method = "local" if self._local.available else "regex"
+        if self._anchor_method == "regex":
+            log.warning("⚠️  No local model — regex-only classification")
+
+    def _set_anchors(self, vecs: Optional[np.ndarray]) -> bool:
+        """Install anchor vectors (rows in CATEGORY_ANCHORS order)."""
+        categories = list(config.CATEGORY_NAMES)
+
+        if vecs is not None and len(vecs):
+            # Normalize once here (no-op for normalize_embeddings=True models)
+            # so scoring is a plain matmul with no per-call norms.
+            vecs  = np.asarray(vecs, dtype=np.float32)
+            norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+            self._anchor_matrix = _storage(vecs / np.where(norms == 0, 1.0, norms))
+            self._anchors = dict(zip(categories, self._anchor_matrix))
+            self._anchor_cats = categories
+            self._weights = config.CATEGORY_WEIGHTS
             self._anchor_method = "local"
             log.info(f"✅ {len(self._anchors)} anchors ready (local AI)")
-        else:
-            self._anchor_method = "regex"
-            log.warning("⚠️  No anchor embeddings — regex-only classification")
+            return True
+
+        self._anchor_method = "regex"
+        log.warning("⚠️  No anchor embeddings — regex-only classification")
+        return False
+
+    def _embed(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Article embeddings. First call encodes anchors in the same batch."""
+        if self._anchor_matrix is not None:
+            return self._local.encode(texts)
+
+        descs  = list(config.CATEGORY_DESCS)
+        cached = _load_anchor_file(descs)
+        if cached is not None:
+            model, anchors = cached
+            vecs = self._local.encode(texts)
+            if vecs is None:
+                return None
+            if self._local.last_model == model and vecs.shape[1] == anchors.shape[1]:
+                log.info(f"🧠 Category anchors loaded from cache ({model})")
+                self._set_anchors(anchors)
+                return vecs
+            log.info("🧠 Anchor cache is for another model — re-encoding")
+
+        log.info("🧠 Computing category anchor embeddings (batched with articles)...")
+        vecs = self._local.encode(descs + texts)
+        if not self._set_anchors(None if vecs is None else vecs[:len(descs)]):
+            return None
+        _save_anchor_file(descs, self._local.last_model, vecs[:len(descs)])
+        return vecs[len(descs):]
 
     def _classify_by_embedding(
-        self, embedding: List[float]
-    ) -> Tuple[str, float, str]:
-        """Returns (category, score, method='embedding')."""
-        best_cat, best_sim = "GENERAL", -1.0
-        for cat, anchor in self._anchors.items():
-            sim = _cosine(embedding, anchor)
-            if sim > best_sim:
-                best_sim, best_cat = sim, cat
-
-        weight = config.CATEGORY_ANCHORS.get(best_cat, {}).get("weight", 0)
-        score  = -50.0 if best_cat == "NOISE" else (best_sim * 10.0) + weight
-        return best_cat, round(score, 2), "embedding"
+        self, embeddings: np.ndarray
+    ) -> List[Tuple[str, float, str, float]]:
+        """
+        Batched: one [N, D] @ [D, C] matmul for all articles.
+        Embeddings are unit-norm (normalize_embeddings=True) → dot = cosine.
+        Returns [(category, score, method='embedding', margin), ...] per row,
+        margin = best minus runner-up similarity (confidence signal).
+        """
+        # fp16 storage → fp32 only at the GEMM boundary
+        emb_mat  = np.ascontiguousarray(embeddings, dtype=np.float32)
+        anchors  = np.ascontiguousarray(self._anchor_matrix, dtype=np.float32)
+        if log.isEnabledFor(logging.DEBUG) and len(emb_mat):
+            if not np.allclose(np.linalg.norm(emb_mat, axis=1), 1.0, atol=1e-2):
+                log.debug("Article embeddings are not unit-norm — scores are not cosine")
+        if _COSINE_KERNEL is not None:
+            sims = _COSINE_KERNEL(emb_mat, anchors)
+        else:
+            sims = emb_mat @ anchors.T
+        top      = _topk(sims, 2)
+        rows     = np.arange(len(sims))
+        best_idx = top[:, 0]
+        best_sim = sims[rows, best_idx]
+        margins  = (best_sim - sims[rows, top[:, 1]]) if top.shape[1] > 1 \
+            else np.zeros_like(best_sim)
+        scores   = best_sim * 10.0 + self._weights[best_idx]
+
+        results = []
+        for idx, score, margin in zip(best_idx.tolist(), scores.tolist(),
+                                      margins.tolist()):
+            cat = self._anchor_cats[idx]
+            if cat == "NOISE":
+                score = -50.0
+            results.append((cat, round(score, 2), "embedding", round(margin, 4)))
+        return results
 
     def _classify_by_regex(self, text: str) -> Tuple[str, float, str]:
         """Returns (category, score, method='regex')."""
@@ -158,7 +586,8 @@ class AIEngine:
     def process_articles(self, articles: List[Dict]) -> List[Dict]:
         """
         Classify and score all articles in one batch call.
-        Attaches: category, score, embedding, classification_method
+        Attaches: category, score, embedding, classification_method,
+                  category_margin (embedding only)
         """
         if not articles:
             return []
@@ -169,15 +598,23 @@ class AIEngine:
         # Batch embed
         embeddings = None
         if self._anchor_method == "local":
-            embeddings = self._local.encode(texts)
+            embeddings = self._embed(texts)
+            if embeddings is not None:
+                embeddings = _storage(embeddings)
+
+        by_embedding = None
+        if embeddings is not None and self._anchor_matrix is not None:
+            by_embedding = self._classify_by_embedding(embeddings)
 
         method_counts: Dict[str, int] = {}
 
         for i, article in enumerate(articles):
-            emb = embeddings[i] if embeddings and i < len(embeddings) else None
+            # Row view of the [N, D] batch — no per-article list copy
+            emb = embeddings[i] if embeddings is not None and i < len(embeddings) else None
 
-            if emb is not None and self._anchors:
-                cat, score, method = self._classify_by_embedding(emb)
+            margin = None
+            if emb is not None and by_embedding is not None:
+                cat, score, method, margin = by_embedding[i]
             else:
                 cat, score, method = self._classify_by_regex(texts[i])
                 emb = None  # don't store None embeddings in Chroma
@@ -186,6 +623,7 @@ class AIEngine:
             article["score"]                  = score
             article["embedding"]              = emb
             article["classification_method"]  = method
+            article["category_margin"]        = margin
             method_counts[method] = method_counts.get(method, 0) + 1
 
         log.info(f"✅ Done. Methods used: {method_counts}")
@@ -17,17 +17,45 @@ import json
 import logging
 import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
 log = logging.getLogger("ai_writer")
 
+# orjson (Rust) if installed — its JSONDecodeError subclasses json's
+try:
+    import orjson
+
+    def _loads(s):
+        return orjson.loads(s)
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _loads(s):
+        return json.loads(s)
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Shared keep-alive session — reuses TCP+TLS across providers / alerts.
+# Retries stay in the provider chain, not the transport.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=10, max_retries=Retry(total=0),
+))
+
 
 # ── Data class ────────────────────────────────────────
 
@@ -49,40 +77,55 @@ class _RateLimitTracker:
     """
     JSON-backed per-day provider block list.
     Auto-resets on new calendar day.
+    Disk is read once per day; state is cached in memory and
+    written through on mutation (this process is the only writer).
+    Race-mode threads share it, so every read/modify/write holds _lock.
     """
 
     def __init__(self):
         self._path: Path = config.BLOG_CONFIG["rate_limit_file"]
+        self._cache: Optional[dict] = None
+        self._cache_date: Optional[str] = None
+        self._lock = threading.RLock()
 
     def _load(self) -> dict:
+        today = str(date.today())
+        if self._cache is not None and self._cache_date == today:
+            return self._cache
+        state = {"date": today, "blocked": []}
         try:
             if self._path.exists():
-                data = json.loads(self._path.read_text())
-                if data.get("date") == str(date.today()):
-                    return data
+                data = _loads(self._path.read_bytes())
+                if data.get("date") == today:
+                    state = data
         except Exception:
             pass
-        return {"date": str(date.today()), "blocked": []}
+        self._cache, self._cache_date = state, today
+        return state
 
     def _save(self, state: dict):
+        self._cache, self._cache_date = state, state.get("date")
         try:
-            self._path.write_text(json.dumps(state, indent=2))
+            self._path.write_text(_dumps(state))
         except Exception as e:
             log.warning(f"Could not save rate limit state: {e}")
 
     def is_blocked(self, name: str) -> bool:
-        return name in self._load().get("blocked", [])
+        with self._lock:
+            return name in self._load().get("blocked", [])
 
     def block(self, name: str):
-        state = self._load()
-        if name not in state["blocked"]:
-            state["blocked"].append(name)
-            self._save(state)
+        with self._lock:
+            state = self._load()
+            if name not in state["blocked"]:
+                state["blocked"].append(name)
+                self._save(state)
         log.warning(f"🚫 AI provider '{name}' blocked for today")
 
-    def all_blocked(self, providers: list) -> bool:
-        blocked = self._load().get("blocked", [])
-        active = [p for p in providers if p.get("enabled") and p["name"] not in blocked]
+    def all_blocked(self, providers: tuple) -> bool:
+        with self._lock:
+            blocked = list(self._load().get("blocked", []))
+        active = [p for p in providers if p["name"] not in blocked]
         return len(active) == 0
 
 
@@ -101,7 +144,7 @@ def _tg_alert(text: str):
     if token.startswith("1234567890"):
         return
     try:
-        requests.post(
+        _session.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             json={"chat_id": chat_id, "text": text, "parse_mode": "HTML"},
             timeout=10,
@@ -112,16 +155,7 @@ def _tg_alert(text: str):
 
 # ── Prompt builder ────────────────────────────────────
 
-def _build_prompt(article_title: str, source_content: str,
-                  source_url: str) -> str:
-    cfg = config.BLOG_CONFIG
-    instance = config.INSTANCE_DISPLAY
-    lang  = cfg["language"]
-    tone  = cfg["tone"]
-    min_w = cfg["min_word_count"]
-    max_w = cfg["max_word_count"]
-
-    return f"""You are an expert blog writer for "{instance}".
+_PROMPT_TEMPLATE = """You are an expert blog writer for "{instance}".
 
 Write a complete blog post based on the article below.
 
@@ -129,7 +163,7 @@ SOURCE TITLE: {article_title}
 SOURCE URL:   {source_url}
 SOURCE CONTENT:
 ---
-{source_content[:6000]}
+{source_content}
 ---
 
 REQUIREMENTS:
@@ -150,9 +184,33 @@ Respond ONLY with valid JSON in this exact format (no markdown, no backticks):
   "fb_summary": "5-10 line Facebook caption with attention-grabbing first line, brief description, and ending with the article URL: {source_url}"
 }}"""
 
+# Static per process (.env-driven) — resolved once at import
+_LANG  = config.BLOG_CONFIG["language"]
+_TONE  = config.BLOG_CONFIG["tone"]
+_MIN_W = config.BLOG_CONFIG["min_word_count"]
+_MAX_W = config.BLOG_CONFIG["max_word_count"]
+_PROMPT_CONTENT_CHARS = 6000
+
+
+def _build_prompt(article_title: str, source_content: str,
+                  source_url: str) -> str:
+    return _PROMPT_TEMPLATE.format(
+        instance       = config.INSTANCE_DISPLAY,
+        article_title  = article_title,
+        source_url     = source_url,
+        source_content = source_content[:_PROMPT_CONTENT_CHARS],
+        lang           = _LANG,
+        tone           = _TONE,
+        min_w          = _MIN_W,
+        max_w          = _MAX_W,
+    )
+
 
 # ── Provider implementations ──────────────────────────
 
+# Per-provider HTTP timeouts (seconds); race mode waits for the slowest
+_HTTP_TIMEOUT = {"gemini": 60, "groq": 60, "grok": 60, "free": 90}
+
 def _call_gemini(provider: dict, prompt: str) -> Optional[str]:
     url = (
         f"https://generativelanguage.googleapis.com/v1beta/models/"
@@ -162,16 +220,16 @@ def _call_gemini(provider: dict, prompt: str) -> Optional[str]:
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {"temperature": 0.7, "maxOutputTokens": 4096},
     }
-    r = requests.post(url, json=payload, timeout=60)
+    r = _session.post(url, json=payload, timeout=_HTTP_TIMEOUT["gemini"])
     if r.status_code == 429:
         raise _RateLimitError("gemini")
     r.raise_for_status()
-    data = r.json()
+    data = _loads(r.content)
     return data["candidates"][0]["content"]["parts"][0]["text"]
 
 
 def _call_groq(provider: dict, prompt: str) -> Optional[str]:
-    r = requests.post(
+    r = _session.post(
         "https://api.groq.com/openai/v1/chat/completions",
         headers={"Authorization": f"Bearer {provider['api_key']}",
                  "Content-Type": "application/json"},
@@ -181,16 +239,16 @@ def _call_groq(provider: dict, prompt: str) -> Optional[str]:
             "temperature": 0.7,
             "max_tokens":  4096,
         },
-        timeout=60,
+        timeout=_HTTP_TIMEOUT["groq"],
     )
     if r.status_code == 429:
         raise _RateLimitError("groq")
     r.raise_for_status()
-    return r.json()["choices"][0]["message"]["content"]
+    return _loads(r.content)["choices"][0]["message"]["content"]
 
 
 def _call_grok(provider: dict, prompt: str) -> Optional[str]:
-    r = requests.post(
+    r = _session.post(
         "https://api.x.ai/v1/chat/completions",
         headers={"Authorization": f"Bearer {provider['api_key']}",
                  "Content-Type": "application/json"},
@@ -199,12 +257,12 @@ def _call_grok(provider: dict, prompt: str) -> Optional[str]:
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.7,
         },
-        timeout=60,
+        timeout=_HTTP_TIMEOUT["grok"],
     )
     if r.status_code == 429:
         raise _RateLimitError("grok")
     r.raise_for_status()
-    return r.json()["choices"][0]["message"]["content"]
+    return _loads(r.content)["choices"][0]["message"]["content"]
 
 
 def _call_free(provider: dict, prompt: str) -> Optional[str]:
@@ -212,7 +270,7 @@ def _call_free(provider: dict, prompt: str) -> Optional[str]:
     import urllib.parse
     encoded = urllib.parse.quote(prompt[:3000])  # free endpoint has limits
     url = f"https://text.pollinations.ai/{encoded}"
-    r   = requests.get(url, timeout=90)
+    r   = _session.get(url, timeout=_HTTP_TIMEOUT["free"])
     r.raise_for_status()
     return r.text
 
@@ -226,6 +284,9 @@ _CALLERS = {
 }
 
 
+_RACE_TIMEOUT_SEC = max(_HTTP_TIMEOUT.values()) + 5   # never cut off a working provider
+
+
 class _RateLimitError(Exception):
     def __init__(self, provider: str):
         self.provider = provider
@@ -234,6 +295,35 @@ class _RateLimitError(Exception):
 
 # ── Response parser ───────────────────────────────────
 
+def _extract_json_span(s: str) -> Optional[str]:
+    """
+    Single forward scan: first '{' to its matching '}', aware of JSON
+    strings/escapes. Ignores trailing chatter after the object.
+    """
+    start = s.find("{")
+    if start < 0:
+        return None
+    depth, in_string, escape = 0, False, False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return None
+
+
 def _parse_response(raw: str) -> Optional[dict]:
     """
     Extract JSON from AI response.
@@ -248,15 +338,15 @@ def _parse_response(raw: str) -> Optional[dict]:
 
     # Try direct parse
     try:
-        return json.loads(cleaned)
+        return _loads(cleaned)
     except json.JSONDecodeError:
         pass
 
-    # Find first {...} block
-    match = re.search(r"\{.*\}", cleaned, re.DOTALL)
-    if match:
+    # Find first balanced {...} block
+    span = _extract_json_span(cleaned)
+    if span:
         try:
-            return json.loads(match.group())
+            return _loads(span)
         except json.JSONDecodeError:
             pass
 
@@ -280,6 +370,100 @@ def _validate(data: dict) -> bool:
 
 # ── Main entry point ──────────────────────────────────
 
+def _active_providers(providers: tuple) -> list:
+    """Not blocked today and with a known caller — in priority order.
+    config.AI_PROVIDERS already excludes providers without an API key."""
+    active = []
+    for provider in providers:
+        name = provider["name"]
+
+        # Skip rate-limited for today
+        if _rl.is_blocked(name):
+            log.info(f"⏭️  {name}: blocked today")
+            continue
+
+        if name in _CALLERS:
+            active.append(provider)
+    return active
+
+
+def _try_provider(provider: dict, prompt: str,
+                  source_url: str) -> Optional[BlogPost]:
+    """Call one provider → validated BlogPost, or None. Never raises."""
+    name   = provider["name"]
+    caller = _CALLERS[name]
+
+    log.info(f"🤖 Trying AI provider: {name} / {provider['model']}")
+
+    try:
+        raw = caller(provider, prompt)
+
+        if not raw:
+            log.warning(f"⚠️  {name} returned empty response")
+            return None
+
+        data = _parse_response(raw)
+        if not data or not _validate(data):
+            log.warning(f"⚠️  {name} response invalid — trying next provider")
+            return None
+
+        post = BlogPost(
+            title            = data["title"].strip(),
+            body_html        = data["body_html"].strip(),
+            tags             = data.get("tags", [])[:10],
+            meta_description = data.get("meta_description", "")[:155],
+            category_hint    = data.get("category_hint", ""),
+            fb_summary       = data.get("fb_summary", ""),
+            provider_used    = name,
+            source_url       = source_url,
+        )
+
+        log.info(f"✅ Blog generated via {name}: '{post.title[:60]}'")
+        return post
+
+    except _RateLimitError as e:
+        # Block this provider for today and alert
+        _rl.block(e.provider)
+        msg = (
+            f"⚠️ <b>{config.INSTANCE_DISPLAY}</b>\n"
+            f"AI provider <b>{e.provider}</b> hit rate limit.\n"
+            f"Blocked for today. Trying next provider..."
+        )
+        _tg_alert(msg)
+        log.warning(f"Rate limit hit: {e.provider}")
+
+    except requests.exceptions.Timeout:
+        log.warning(f"⏱️  {name} timed out")
+
+    except requests.exceptions.HTTPError as e:
+        log.warning(f"❌ {name} HTTP error: {e.response.status_code}")
+
+    except Exception as e:
+        log.error(f"❌ {name} unexpected error: {e}")
+
+    return None
+
+
+def _race_providers(active: list, prompt: str,
+                    source_url: str) -> Optional[BlogPost]:
+    """
+    Speculative mode: call all active providers at once, keep the first
+    valid post. Stragglers are abandoned (their HTTP timeouts still apply).
+    """
+    ex = ThreadPoolExecutor(max_workers=len(active))
+    futures = {ex.submit(_try_provider, p, prompt, source_url): p for p in active}
+    try:
+        for fut in as_completed(futures, timeout=_RACE_TIMEOUT_SEC):
+            post = fut.result()
+            if post:
+                return post
+    except FuturesTimeout:
+        log.warning(f"⏱️  No provider answered within {_RACE_TIMEOUT_SEC}s")
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+    return None
+
+
 def generate(article_title: str, source_content: str,
              source_url: str = "") -> Optional[BlogPost]:
     """
@@ -287,6 +471,7 @@ def generate(article_title: str, source_content: str,
 
     Returns BlogPost on success, None if all providers are blocked/failed.
     Sends a Telegram alert if a provider is rate-limited.
+    With BLOG_CONFIG["speculative"], providers are raced concurrently.
     """
     if not source_content:
         log.error("❌ No source content to generate blog from")
@@ -294,75 +479,17 @@ def generate(article_title: str, source_content: str,
 
     providers = config.AI_PROVIDERS
     prompt    = _build_prompt(article_title, source_content, source_url)
+    active    = _active_providers(providers)
 
-    for provider in providers:
-        name = provider["name"]
-
-        # Skip disabled (no API key)
-        if not provider.get("enabled"):
-            log.debug(f"⏭️  {name}: disabled (no key)")
-            continue
-
-        # Skip rate-limited for today
-        if _rl.is_blocked(name):
-            log.info(f"⏭️  {name}: blocked today")
-            continue
-
-        caller = _CALLERS.get(name)
-        if not caller:
-            continue
-
-        log.info(f"🤖 Trying AI provider: {name} / {provider['model']}")
-
-        try:
-            raw = caller(provider, prompt)
-
-            if not raw:
-                log.warning(f"⚠️  {name} returned empty response")
-                continue
-
-            data = _parse_response(raw)
-            if not data or not _validate(data):
-                log.warning(f"⚠️  {name} response invalid — trying next provider")
-                continue
-
-            post = BlogPost(
-                title            = data["title"].strip(),
-                body_html        = data["body_html"].strip(),
-                tags             = data.get("tags", [])[:10],
-                meta_description = data.get("meta_description", "")[:155],
-                category_hint    = data.get("category_hint", ""),
-                fb_summary       = data.get("fb_summary", ""),
-                provider_used    = name,
-                source_url       = source_url,
-            )
-
-            log.info(f"✅ Blog generated via {name}: '{post.title[:60]}'")
+    if active and config.BLOG_CONFIG.get("speculative", False):
+        post = _race_providers(active, prompt, source_url)
+        if post:
             return post
-
-        except _RateLimitError as e:
-            # Block this provider for today and alert
-            _rl.block(e.provider)
-            msg = (
-                f"⚠️ <b>{config.INSTANCE_DISPLAY}</b>\n"
-                f"AI provider <b>{e.provider}</b> hit rate limit.\n"
-                f"Blocked for today. Trying next provider..."
-            )
-            _tg_alert(msg)
-            log.warning(f"Rate limit hit: {e.provider}")
-            continue
-
-        except requests.exceptions.Timeout:
-            log.warning(f"⏱️  {name} timed out")
-            continue
-
-        except requests.exceptions.HTTPError as e:
-            log.warning(f"❌ {name} HTTP error: {e.response.status_code}")
-            continue
-
-        except Exception as e:
-            log.error(f"❌ {name} unexpected error: {e}")
-            continue
+    else:
+        for provider in active:
+            post = _try_provider(provider, prompt, source_url)
+            if post:
+                return post
 
     # All providers exhausted
     blocked = _rl.all_blocked(providers)
@@ -1,19 +1,19 @@
 """
 blogger.py - Blog Pipeline Orchestrator.
 
-Full flow per article:
+Full flow per article (step 1-3 run concurrently across articles):
   1. Fetch URL content
   2. Generate blog post via AI (with provider fallback)
   3. Generate featured image (Pollinations)
   4. Send to Telegram for approval (staggered, not all at once)
-  5. Collect all decisions (long-poll 30s chunks — no tight loop)
+  5. Collect all decisions (50s server-side long-poll — no idle sleeps)
   6. For approved: upload image → determine WP category → create WP post
   7. Post FB summary with image + WP link
 
 Telegram approval design:
   - One message sent per blog preview (not flooding)
-  - 4s gap between sends (Telegram rate limit safe)
-  - Decisions collected in one shared polling loop (30s sleep chunks)
+  - Sends paced by a token bucket (1 msg/s, burst 3 — Telegram safe)
+  - Decisions collected in one shared long-poll loop (getUpdates timeout=50)
   - No per-article timeout spinning — single shared deadline
   - Unapproved after timeout → skipped (or auto-approved if AUTO_APPROVE=True)
 
@@ -26,25 +26,59 @@ Edge cases:
   - Telegram not configured       → auto-approve all, post directly
   - All AI providers blocked      → skip all blogs today, Telegram alert sent
 """
+import json
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# orjson (Rust) if installed — Telegram payloads/updates are the only
+# CPU work in the poll loop
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+    def _dumpb(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    # Optional: streams multipart bodies from disk (fixed buffer, not whole file)
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 
 import config
 import db
+import wp_client
 from content_fetcher import fetch as fetch_content
 from ai_writer import generate as ai_generate
 from image_gen import generate as gen_image, build_prompt as img_prompt
 
 log = logging.getLogger("blogger")
 
-_SEND_GAP_SEC   = 4     # gap between sending each approval message
-_POLL_CHUNK_SEC = 30    # sleep between each poll sweep
+_SEND_RATE      = 1.0   # Telegram per-chat limit: ~1 msg/s sustained
+_SEND_BURST     = 3     # previews that may go out back-to-back
+_LONG_POLL_SEC  = 50    # getUpdates server-side wait (the poll IS the wait)
+_POLL_ERR_SEC   = 0.5   # back-off only after a failed poll
 _AUTH_ERRORS    = {401, 403}
+_PUBLISH_WORKERS = 3    # concurrent WP publishes (WP rate limits)
+_KEYBOARD_WORKERS = 8   # parallel editMessageReplyMarkup calls
+_EMPTY_KEYBOARD = _dumps({"inline_keyboard": []})
+_JSON_HEADERS   = {"Content-Type": "application/json"}
 
 
 # ── Data class ────────────────────────────────────────
@@ -52,13 +86,51 @@ _AUTH_ERRORS    = {401, 403}
 @dataclass
 class BlogJob:
     article:    dict
+    idx:        int           = 0      # position in this run's batch
     blog_post:  object        = None   # ai_writer.BlogPost
     image_path: Optional[Path] = None
+    image_bytes: Optional[bytes] = None   # in-memory copy of image_path
     tg_msg_id:  int           = 0
     decision:   str           = "pending"  # pending|approved|skipped
     wp_post_id: int           = 0
     wp_url:     str           = ""
     error:      str           = ""
+    # Pre-built in _prepare so the send path is pure network I/O
+    tags_preview:     str     = ""
+    fb_preview:       str     = ""
+    tg_caption:       str     = ""
+    tg_keyboard_json: str     = ""
+
+
+# ── Send rate limiter ─────────────────────────────────
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket. Bursts go out at full speed; callers
+    only wait once the bucket is empty (vs. a blind fixed sleep).
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate   = rate
+        self._burst  = burst
+        self._tokens = float(burst)
+        self._last   = time.monotonic()
+        self._lock   = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last   = now
+            wait = 0.0
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self._rate
+                self._tokens = 0.0
+                self._last   = now + wait
+            else:
+                self._tokens -= 1.0
+        if wait > 0:
+            time.sleep(wait)
 
 
 # ── Thin Telegram helper (no circular import) ─────────
@@ -75,45 +147,58 @@ class _TG:
             and not self.token.startswith("1234567890")
         )
         self._dead = False  # set True on 401
+        # Keep-alive: one TLS connection reused across send/poll/edit calls
+        self._sess = requests.Session()
+        self._sess.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
     @property
     def usable(self) -> bool:
         return self._ok and not self._dead
 
-    def _post(self, method: str, **kwargs) -> Optional[dict]:
+    def _post(self, method: str, timeout: float = 15, **kwargs) -> Optional[dict]:
         if not self.usable:
             return None
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["data"]    = _dumpb(payload)
+            kwargs["headers"] = _JSON_HEADERS
         try:
-            r = requests.post(
+            r = self._sess.post(
                 f"https://api.telegram.org/bot{self.token}/{method}",
-                timeout=15, **kwargs
+                timeout=timeout, **kwargs
             )
             if r.status_code in _AUTH_ERRORS:
                 log.error(f"❌ Telegram auth error — disabling for this run")
                 self._dead = True
                 return None
             r.raise_for_status()
-            data = r.json()
+            data = _loads(r.content)
             return data.get("result") if data.get("ok") else None
         except Exception as e:
             log.warning(f"TG {method}: {e}")
             return None
 
-    def send(self, caption: str, image_path: Path,
-             keyboard: dict) -> Optional[int]:
-        """Send photo+keyboard. Returns message_id or None."""
-        import json
+    def send(self, caption: str, image_path: Path, keyboard_json: str,
+             image_bytes: Optional[bytes] = None) -> Optional[int]:
+        """
+        Send photo+keyboard (pre-serialized). Returns message_id or None.
+        image_bytes, when given, is sent as-is instead of re-reading image_path.
+        """
         data = {
             "chat_id":     self.chat_id,
             "caption":     caption[:1024],
             "parse_mode":  "HTML",
-            "reply_markup": json.dumps(keyboard),
+            "reply_markup": keyboard_json,
         }
         # Try with image first
-        img = image_path or config.DUMMY_IMAGE
+        img = Path(image_path or config.DUMMY_IMAGE)
         try:
-            with open(img, "rb") as f:
-                result = self._post("sendPhoto", data=data, files={"photo": f})
+            if image_bytes is not None:
+                result = self._send_photo(data, (img.name, image_bytes, "image/jpeg"))
+            else:
+                # Stream from disk — the encoder reads the handle in chunks
+                with open(img, "rb") as f:
+                    result = self._send_photo(data, (img.name, f, "image/jpeg"))
             if result:
                 return result.get("message_id")
         except Exception:
@@ -124,11 +209,19 @@ class _TG:
             "chat_id":     self.chat_id,
             "text":        caption[:4096],
             "parse_mode":  "HTML",
-            "reply_markup": __import__("json").dumps(keyboard),
+            "reply_markup": keyboard_json,
             "disable_web_page_preview": False,
         })
         return result.get("message_id") if result else None
 
+    def _send_photo(self, data: dict, photo: tuple) -> Optional[dict]:
+        """sendPhoto with photo = (name, bytes-or-file, mime)."""
+        if MultipartEncoder is not None:
+            body = MultipartEncoder(fields={**data, "photo": photo})
+            return self._post("sendPhoto", data=body,
+                              headers={"Content-Type": body.content_type})
+        return self._post("sendPhoto", data=data, files={"photo": photo})
+
     def plain(self, text: str):
         """Send a plain text message."""
         self._post("sendMessage", json={
@@ -137,59 +230,104 @@ class _TG:
         })
 
     def remove_keyboard(self, msg_id: int):
-        import json
         self._post("editMessageReplyMarkup", json={
             "chat_id":      self.chat_id,
             "message_id":   msg_id,
-            "reply_markup": json.dumps({"inline_keyboard": []}),
+            "reply_markup": _EMPTY_KEYBOARD,
         })
 
     def answer_cb(self, cb_id: str, text: str = ""):
         self._post("answerCallbackQuery",
                    json={"callback_query_id": cb_id, "text": text})
 
-    def get_updates(self) -> list:
-        result = self._post("getUpdates", json={
+    def get_updates(self, wait: int = _LONG_POLL_SEC) -> Optional[list]:
+        """Returns list or None on error (caller tracks streak)."""
+        result = self._post("getUpdates", timeout=wait + 5, json={
             "offset":          self._offset,
-            "timeout":         25,  # long-poll at server side
+            "timeout":         wait,  # long-poll at server side
             "allowed_updates": ["callback_query"],
         })
-        updates = result or []
-        if updates:
-            self._offset = updates[-1]["update_id"] + 1
-        return updates
+        if result is None:
+            return None
+        if result:
+            self._offset = result[-1]["update_id"] + 1
+        return result
 
 
 # ── Approval captions ─────────────────────────────────
 
 def _caption(job: BlogJob) -> str:
-    art  = job.article
     post = job.blog_post
-    return (
-        f"📝 <b>BLOG PREVIEW</b>  |  {config.INSTANCE_DISPLAY}\n\n"
-        f"<b>{post.title}</b>\n\n"
-        f"<i>Category:</i> {post.category_hint or 'Auto'}\n"
-        f"<i>Tags:</i> {', '.join(post.tags[:5])}\n"
-        f"<i>Provider:</i> {post.provider_used}\n\n"
-        f"<b>FB Caption Preview:</b>\n{post.fb_summary[:400]}\n\n"
-        f"🔗 Source: <a href='{art.get('link','')}'>Original Article</a>"
-    )
-
-
-def _keyboard(article_id: int) -> dict:
+    return "".join((
+        "📝 <b>BLOG PREVIEW</b>  |  ", config.INSTANCE_DISPLAY,
+        "\n\n<b>", post.title,
+        "</b>\n\n<i>Category:</i> ", post.category_hint or "Auto",
+        "\n<i>Tags:</i> ", job.tags_preview,
+        "\n<i>Provider:</i> ", post.provider_used,
+        "\n\n<b>FB Caption Preview:</b>\n", job.fb_preview,
+        "\n\n🔗 Source: <a href='", job.article.get("link", ""),
+        "'>Original Article</a>",
+    ))
+
+
+def _keyboard(job_idx: int, article_id: int) -> dict:
+    # "<action>:<job idx>:<article id>" — the index dispatches, the id
+    # rejects stale buttons left over from earlier runs
+    ref = f"{job_idx}:{article_id}"
     return {"inline_keyboard": [[
-        {"text": "✅ Publish",    "callback_data": f"blog_approve:{article_id}"},
-        {"text": "❌ Skip",       "callback_data": f"blog_skip:{article_id}"},
-        {"text": "🚀 Approve All","callback_data": f"blog_all:{article_id}"},
+        {"text": "✅ Publish",    "callback_data": f"blog_approve:{ref}"},
+        {"text": "❌ Skip",       "callback_data": f"blog_skip:{ref}"},
+        {"text": "🚀 Approve All","callback_data": f"blog_all:{ref}"},
     ]]}
 
 
+# ── Callback handlers ─────────────────────────────────
+# Each sets the job's decision; returns True if every pending job
+# should be approved as well.
+
+def _h_approve(job: BlogJob) -> bool:
+    job.decision = "approved"
+    log.info(f"✅ Blog approved: {job.blog_post.title[:50]}")
+    return False
+
+
+def _h_skip(job: BlogJob) -> bool:
+    job.decision = "skipped"
+    log.info(f"⏭️  Blog skipped: {job.blog_post.title[:50]}")
+    return False
+
+
+def _h_all(job: BlogJob) -> bool:
+    job.decision = "approved"
+    log.info("🚀 Approve All triggered — approving remaining blogs")
+    return True
+
+
+_ACTION_HANDLERS = {
+    "blog_approve": _h_approve,
+    "blog_skip":    _h_skip,
+    "blog_all":     _h_all,
+}
+
+
 # ── Main orchestrator ─────────────────────────────────
 
 class Blogger:
 
     def __init__(self):
         self._tg = _TG()
+        # AI providers have tighter per-key limits than fetch / image gen
+        self._ai_sem = threading.BoundedSemaphore(
+            config.BLOG_CONFIG.get("ai_concurrency", 2)
+        )
+        # WP category name (lowercased) → Future of its GraphQL global ID
+        # (wp_client.get_or_create_category returns a str, not databaseId);
+        # one lookup per category per run
+        self._cat_cache: dict[str, Future] = {}
+        self._cat_lock  = threading.Lock()
+        # One FacebookPlatform (and its keep-alive session) for every job
+        self._fb        = None
+        self._fb_lock   = threading.Lock()
 
     def run(self, articles: list[dict]) -> dict:
         """
@@ -206,45 +344,63 @@ class Blogger:
         summary = {"generated": 0, "approved": 0, "published": 0,
                    "skipped": 0, "errors": 0}
 
-        # ── Phase 1: Prepare all jobs ──────────────────
-        jobs: list[BlogJob] = []
-        for art in articles:
-            job = self._prepare(art)
-            if job:
-                jobs.append(job)
-                summary["generated"] += 1
-            else:
-                summary["errors"] += 1
+        # ── Phase 1+2: Prepare jobs, send each preview when ready ──
+        jobs = self._prepare_and_send(articles, summary)
 
         if not jobs:
             log.warning("⚠️  No blog posts generated")
             return summary
 
-        # ── Phase 2: Send all to Telegram (staggered) ──
-        jobs = self._send_approvals(jobs)
-
         # ── Phase 3: Collect all decisions ────────────
         jobs = self._collect_decisions(jobs)
 
-        # ── Phase 4: Publish approved ─────────────────
+        # ── Phase 4: Publish approved (concurrent) ────
+        approved = [j for j in jobs if j.decision == "approved"]
         for job in jobs:
-            if job.decision == "approved":
-                ok = self._publish(job)
-                if ok:
-                    summary["published"] += 1
-                    summary["approved"] += 1
-                else:
-                    summary["errors"] += 1
-            else:
+            if job.decision != "approved":
                 summary["skipped"] += 1
                 log.info(f"⏭️  Skipped: {job.blog_post.title[:50]}")
 
+        if approved:
+            with ThreadPoolExecutor(max_workers=_PUBLISH_WORKERS) as ex:
+                for ok in ex.map(self._publish_safe, approved):
+                    if ok:
+                        summary["published"] += 1
+                        summary["approved"] += 1
+                    else:
+                        summary["errors"] += 1
+
+        self._record(jobs)
+
         log.info(f"📊 Blog summary: {summary}")
         return summary
 
+    @staticmethod
+    def _record(jobs: list[BlogJob]):
+        """Log each WordPress publish attempt in a single DB commit (skips aren't posts)."""
+        if config.TEST_MODE or config.DRY_RUN:
+            return
+        rows = [
+            (job.article["id"], "wordpress", str(job.wp_post_id or ""),
+             "published" if job.wp_url else "failed", job.error)
+            for job in jobs if job.wp_url or job.decision == "approved"
+        ]
+        try:
+            db.log_publish_many(rows)
+        except Exception as e:
+            log.warning(f"⚠️  Could not record blog results: {e}")
+
     # ── Phase 1: Fetch + generate ──────────────────────
 
-    def _prepare(self, article: dict) -> Optional[BlogJob]:
+    def _prepare_safe(self, article: dict, idx: int = 0) -> Optional[BlogJob]:
+        """Worker-thread entry: one article's failure never sinks the batch."""
+        try:
+            return self._prepare(article, idx)
+        except Exception as e:
+            log.error(f"❌ Blog prepare error ({article.get('title','')[:50]}): {e}")
+            return None
+
+    def _prepare(self, article: dict, idx: int = 0) -> Optional[BlogJob]:
         title   = article.get("title", "")
         url     = article.get("link", "")
         summary = article.get("summary", "")
@@ -259,212 +415,253 @@ class Blogger:
             return None
 
         # Generate blog with AI
-        blog_post = ai_generate(
-            article_title  = title,
-            source_content = fetched.content,
-            source_url     = url,
-        )
+        with self._ai_sem:
+            blog_post = ai_generate(
+                article_title  = title,
+                source_content = fetched.content,
+                source_url     = url,
+            )
         if not blog_post:
             log.warning(f"⚠️  AI generation failed for '{title[:50]}'")
             return None
 
         # Generate image
         prompt = img_prompt(blog_post.title, cat, config.INSTANCE_DISPLAY)
-        image  = gen_image(prompt, filename_hint=blog_post.title)
-
-        return BlogJob(
-            article    = article,
-            blog_post  = blog_post,
-            image_path = image,
+        image, image_bytes = gen_image(prompt, filename_hint=blog_post.title,
+                                       return_bytes=True)
+
+        job = BlogJob(
+            article     = article,
+            idx         = idx,
+            blog_post   = blog_post,
+            image_path  = image,
+            image_bytes = image_bytes,
         )
+        job.tags_preview     = ", ".join(blog_post.tags[:5])
+        job.fb_preview       = blog_post.fb_summary[:400]
+        job.tg_caption       = _caption(job)
+        job.tg_keyboard_json = _dumps(_keyboard(idx, article["id"]))
+        return job
+
+    def _prepare_and_send(self, articles: list[dict], summary: dict) -> list[BlogJob]:
+        """
+        Producer/consumer: prepare workers (fetch → AI → image) hand each
+        finished job straight to the rate-limited sender, so previews reach
+        Telegram while later articles are still being generated.
+        Returns jobs in article order.
+        """
+        send    = self._approval_sender()
+        slots: list[Optional[BlogJob]] = [None] * len(articles)
+        workers = max(1, min(len(articles), config.BLOG_CONFIG.get("concurrency", 5)))
+
+        sends = {}
+        with ThreadPoolExecutor(max_workers=workers) as prep, \
+             ThreadPoolExecutor(max_workers=_SEND_BURST) as sender:
+            futs = {prep.submit(self._prepare_safe, art, i): i
+                    for i, art in enumerate(articles)}
+            for fut in as_completed(futs):
+                job = fut.result()
+                if not job:
+                    summary["errors"] += 1
+                    continue
+                summary["generated"] += 1
+                slots[futs[fut]] = job
+                sends[sender.submit(send, job)] = job
+
+        # Surface send-step crashes; treat them like a failed send
+        for fut, job in sends.items():
+            try:
+                fut.result()
+            except Exception as e:
+                log.error(f"❌ Preview send error ({job.blog_post.title[:40]}): {e} — auto-approving")
+                job.decision = "approved"
 
-    # ── Phase 2: Staggered Telegram sends ─────────────
+        return [j for j in slots if j]
 
-    def _send_approvals(self, jobs: list[BlogJob]) -> list[BlogJob]:
+    # ── Phase 2: Rate-limited Telegram sends ──────────
+
+    def _approval_sender(self):
         """
-        Send each blog preview to Telegram with _SEND_GAP_SEC gap.
-        If Telegram unavailable → mark all approved (auto).
+        Return the per-job send step for this run, paced by a token bucket.
+        If Telegram unavailable → every job is approved (auto).
         """
         if not self._tg.usable:
             log.info("ℹ️  Telegram unavailable — auto-approving all blogs")
-            for job in jobs:
+
+            def _auto(job: BlogJob):
                 job.decision = "approved"
-            return jobs
+            return _auto
+
+        bucket = _TokenBucket(_SEND_RATE, _SEND_BURST)
 
         if config.AUTO_APPROVE:
             log.info("ℹ️  AUTO_APPROVE=True — sending notifications only")
-            for job in jobs:
+
+            def _notify(job: BlogJob):
+                bucket.acquire()
                 self._tg.plain(
                     f"🤖 Auto-publishing blog: <b>{job.blog_post.title}</b>"
                 )
                 job.decision = "approved"
-                time.sleep(_SEND_GAP_SEC)
-            return jobs
+            return _notify
+
+        log.info("📤 Sending blog previews to Telegram as they are ready...")
 
-        log.info(f"📤 Sending {len(jobs)} blog previews to Telegram...")
-        for i, job in enumerate(jobs):
+        def _send_one(job: BlogJob):
+            bucket.acquire()   # rate-limited, but HTTP round trips overlap
             msg_id = self._tg.send(
-                caption    = _caption(job),
-                image_path = job.image_path,
-                keyboard   = _keyboard(job.article["id"]),
+                caption       = job.tg_caption,
+                image_path    = job.image_path,
+                keyboard_json = job.tg_keyboard_json,
+                image_bytes   = job.image_bytes,
             )
             if msg_id:
                 job.tg_msg_id = msg_id
-                log.info(f"  ✉️  Sent preview {i+1}/{len(jobs)}: msg_id={msg_id}")
+                log.info(f"  ✉️  Sent preview: msg_id={msg_id}")
             else:
                 log.warning(f"  ⚠️  Send failed for '{job.blog_post.title[:40]}' — auto-approving")
                 job.decision = "approved"
-
-            # Gap between sends — Telegram allows 30 msgs/sec but be polite
-            if i < len(jobs) - 1:
-                time.sleep(_SEND_GAP_SEC)
-
-        return jobs
+        return _send_one
 
     # ── Phase 3: Collect decisions (shared poll loop) ──
 
     def _collect_decisions(self, jobs: list[BlogJob]) -> list[BlogJob]:
         """
         Single polling loop for all pending jobs.
-        Polls in 30s chunks — NOT a tight loop.
+        Each getUpdates long-polls up to 50s server-side — no idle sleeps,
+        callbacks are handled as soon as they arrive.
         Stops early when all jobs have decisions.
         """
         # Jobs that already have a decision (auto-approved or send failed)
-        pending = {j.article["id"]: j for j in jobs if j.decision == "pending"}
-
-        if not pending:
+        # stay None; callbacks index straight into this list
+        slots: list[Optional[BlogJob]] = [None] * (max((j.idx for j in jobs), default=-1) + 1)
+        for j in jobs:
+            if j.decision == "pending":
+                slots[j.idx] = j
+        remaining = sum(1 for j in slots if j)
+
+        if not remaining:
             return jobs
 
         if not self._tg.usable:
-            for job in pending.values():
+            for job in filter(None, slots):
                 job.decision = "approved"
             return jobs
 
         timeout     = config.BLOG_CONFIG["approval_timeout_sec"]
-        deadline    = time.time() + timeout
-        approve_all = False
+        deadline    = time.monotonic() + timeout   # immune to NTP / clock jumps
         err_streak  = 0
 
         log.info(
-            f"⏳ Waiting for decisions on {len(pending)} blog(s) "
-            f"(timeout={timeout}s, poll every {_POLL_CHUNK_SEC}s)..."
+            f"⏳ Waiting for decisions on {remaining} blog(s) "
+            f"(timeout={timeout}s, long-poll {_LONG_POLL_SEC}s)..."
         )
 
-        while pending and time.time() < deadline:
-            updates = self._tg.get_updates()
+        while remaining:
+            time_left = deadline - time.monotonic()
+            if time_left <= 0:
+                break
+            # Never long-poll past the deadline
+            wait    = int(min(_LONG_POLL_SEC, max(time_left, 1)))
+            updates = self._tg.get_updates(wait)
 
             if updates is None:
                 err_streak += 1
                 if err_streak >= 3:
                     log.warning("⚠️  3 consecutive Telegram errors — auto-approving remaining")
-                    for job in pending.values():
+                    for job in filter(None, slots):
                         job.decision = "approved"
                     return jobs
-            else:
-                err_streak = 0
+                time.sleep(_POLL_ERR_SEC)   # don't hot-loop on failures
+                continue
+            err_streak = 0
 
-            for upd in (updates or []):
+            for upd in updates:
                 cq   = upd.get("callback_query", {})
                 data = cq.get("data", "")
                 cb_id = cq.get("id", "")
-                parts = data.split(":")
-                if len(parts) != 2:
-                    continue
-
-                action, art_id_str = parts
-                if action not in ("blog_approve", "blog_skip", "blog_all"):
+                action, sep, ref = data.partition(":")
+                handler = _ACTION_HANDLERS.get(action)
+                idx_str, _, art_id_str = ref.partition(":")
+                if not handler or not sep or not idx_str.isdigit():
                     continue  # not for us (news approval etc.)
 
-                try:
-                    art_id = int(art_id_str)
-                except ValueError:
-                    continue
-
-                # Could be a job not in our current batch — ignore
-                job = pending.get(art_id)
-                if not job:
+                # Could be a button from an earlier batch — ignore
+                idx = int(idx_str)
+                job = slots[idx] if idx < len(slots) else None
+                if not job or str(job.article["id"]) != art_id_str:
                     continue
 
                 self._tg.answer_cb(cb_id, "✅ Got it!")
                 if job.tg_msg_id:
                     self._tg.remove_keyboard(job.tg_msg_id)
 
-                if action == "blog_approve":
-                    job.decision = "approved"
-                    log.info(f"✅ Blog approved: {job.blog_post.title[:50]}")
-
-                elif action == "blog_skip":
-                    job.decision = "skipped"
-                    log.info(f"⏭️  Blog skipped: {job.blog_post.title[:50]}")
-
-                elif action == "blog_all":
-                    job.decision = "approved"
-                    approve_all  = True
-                    log.info("🚀 Approve All triggered — approving remaining blogs")
-
-                del pending[art_id]
+                approve_all = handler(job)
+                slots[idx]  = None
+                remaining  -= 1
 
                 # If approve_all: approve everything still pending
                 if approve_all:
-                    for j in list(pending.values()):
-                        j.decision = "approved"
-                        if j.tg_msg_id:
-                            self._tg.remove_keyboard(j.tg_msg_id)
-                    pending.clear()
+                    self._finalize(slots, "approved")
+                    remaining = 0
                     break
 
-            if not pending:
-                break
-
-            # Sleep in one chunk — wake when chunk done or deadline near
-            remaining = deadline - time.time()
-            sleep_for  = min(_POLL_CHUNK_SEC, max(remaining, 0))
-            if sleep_for > 0:
-                time.sleep(sleep_for)
+            # No sleep here — the next long-poll blocks server-side until
+            # a callback arrives (or _LONG_POLL_SEC passes)
 
         # Timeout — apply policy
-        if pending:
+        if remaining:
             policy = "approved" if config.AUTO_APPROVE else "skipped"
             log.info(
-                f"⏱️  Timeout: {len(pending)} blog(s) → {policy} "
+                f"⏱️  Timeout: {remaining} blog(s) → {policy} "
                 f"(AUTO_APPROVE={config.AUTO_APPROVE})"
             )
-            for job in pending.values():
-                job.decision = policy
-                if job.tg_msg_id:
-                    self._tg.remove_keyboard(job.tg_msg_id)
+            self._finalize(slots, policy)
 
         return jobs
 
+    def _finalize(self, slots: list[Optional[BlogJob]], decision: str):
+        """Apply one decision to every still-pending slot and drop their keyboards."""
+        msg_ids = []
+        for job in filter(None, slots):
+            job.decision = decision
+            if job.tg_msg_id:
+                msg_ids.append(job.tg_msg_id)
+        self._remove_keyboards(msg_ids)
+
+    def _remove_keyboards(self, msg_ids: list[int]):
+        """Strip inline keyboards concurrently — ~1 RTT instead of N."""
+        if not msg_ids:
+            return
+        workers = min(len(msg_ids), _KEYBOARD_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(self._tg.remove_keyboard, msg_ids))
+
     # ── Phase 4: Publish to WP + FB ───────────────────
 
+    def _publish_safe(self, job: BlogJob) -> bool:
+        try:
+            return self._publish(job)
+        except Exception as e:
+            log.error(f"❌ Publish error ({job.blog_post.title[:50]}): {e}")
+            job.error = job.error or str(e)
+            return False
+
     def _publish(self, job: BlogJob) -> bool:
         post = job.blog_post
         art  = job.article
         log.info(f"🚀 Publishing to WordPress: '{post.title[:60]}'")
 
-        # Resolve / create WP category
-        cat_id = None
-        if post.category_hint:
-            try:
-                import wp_client
-                cat_id = wp_client.get_or_create_category(post.category_hint)
-            except Exception as e:
-                log.warning(f"⚠️  Category lookup failed: {e}")
-
-        # Upload featured image
-        media_id = None
+        # Category lookup + image upload are independent → run side by side
         img_path = job.image_path or config.DUMMY_IMAGE
-        try:
-            import wp_client
-            media_id = wp_client.upload_image(img_path)
-        except Exception as e:
-            log.warning(f"⚠️  Image upload failed: {e}")
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            cat_fut   = ex.submit(self._resolve_category, post.category_hint)
+            media_fut = ex.submit(self._upload_image, img_path, job.image_bytes)
+            cat_id, media_id = cat_fut.result(), media_fut.result()
 
         # Create WP post
         wp_result = None
         try:
-            import wp_client
             wp_result = wp_client.create_post(
                 title             = post.title,
                 body_html         = post.body_html,
@@ -476,9 +673,11 @@ class Blogger:
             )
         except Exception as e:
             log.error(f"❌ WP post creation error: {e}")
+            job.error = str(e)
 
         if not wp_result:
             log.error(f"❌ Failed to publish to WordPress: {post.title[:50]}")
+            job.error = job.error or "WordPress returned no post"
             return False
 
         wp_url = wp_result.get("link", "")
@@ -501,9 +700,55 @@ class Blogger:
 
         return True
 
+    def _resolve_category(self, hint: str) -> Optional[str]:
+        """
+        Resolve / create WP category. None on failure or no hint.
+        Cached per Blogger as one Future per name: the first publish to ask
+        does the lookup, concurrent publishes for the same name wait on it,
+        other names proceed in parallel. Failures are not cached.
+        """
+        if not hint:
+            return None
+        key = hint.lower()
+        with self._cat_lock:
+            fut   = self._cat_cache.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._cat_cache[key] = Future()
+        if not owner:
+            return fut.result()
+
+        try:
+            cat_id = wp_client.get_or_create_category(hint)
+        except Exception as e:
+            log.warning(f"⚠️  Category lookup failed: {e}")
+            cat_id = None
+        if cat_id is None:
+            with self._cat_lock:
+                self._cat_cache.pop(key, None)
+        fut.set_result(cat_id)
+        return cat_id
+
+    @staticmethod
+    def _upload_image(img_path, image_bytes: Optional[bytes] = None):
+        """Upload featured image. None on failure."""
+        try:
+            return wp_client.upload_image(img_path, image_bytes=image_bytes)
+        except Exception as e:
+            log.warning(f"⚠️  Image upload failed: {e}")
+            return None
+
+    def _facebook(self):
+        """Build the FacebookPlatform on first use; publish threads share it."""
+        with self._fb_lock:
+            if self._fb is None:
+                from platforms.facebook import FacebookPlatform
+                self._fb = FacebookPlatform()
+            return self._fb
+
     def _post_fb(self, job: BlogJob, wp_url: str):
         """Post FB summary + image + WP link."""
-        if "facebook" not in config.ENABLED_PLATFORMS:
+        if "facebook" not in config.ENABLED_PLATFORM_SET:
             return
         if not wp_url:
             return
@@ -516,9 +761,12 @@ class Blogger:
         )
 
         try:
-            from platforms.facebook import FacebookPlatform
-            fb = FacebookPlatform()
-            result = fb.send(text=caption, image_path=str(img_path), link=wp_url)
+            result = self._facebook().send(
+                text        = caption,
+                image_path  = str(img_path),
+                link        = wp_url,
+                image_bytes = job.image_bytes,
+            )
             if result.success:
                 log.info(f"✅ FB posted: {result.platform_post_id}")
             else:
@@ -2,27 +2,96 @@
 config.py - Single source of truth for all settings.
 Copy this project folder and change INSTANCE_NAME + .env for a new niche.
 """
+import functools
 import os
+import re
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+
+try:
+    # Optional: RE2 automaton — linear-time matching on long article bodies
+    import re2
+    _RE2_CI = re2.Options()
+    _RE2_CI.case_sensitive = False
+
+    def _icompile(pattern: str):
+        return re2.compile(pattern, _RE2_CI)
+except ImportError:
+    def _icompile(pattern: str):
+        return re.compile(pattern, re.IGNORECASE)
 
 # ── Load .env ─────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).parent
-load_dotenv(PROJECT_ROOT / ".env")
 
+
+def _load_env(path: Path):
+    """
+    Minimal KEY=VALUE reader (one read, no regex). Like load_dotenv, real env
+    vars win; supports `export `, quoted values and ` # inline comments`.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return
+    values = {}                                       # later duplicates win
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == "#" or "=" not in line:
+            continue
+        key, _, val = line.partition("=")
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[7:].strip()
+        val = val.strip()
+        if val and val[0] in "\"'" and val.find(val[0], 1) > 0:
+            val = val[1:val.find(val[0], 1)]
+        else:
+            cut = [i for i in (val.find(" #"), val.find("\t#")) if i >= 0]
+            if cut:
+                val = val[:min(cut)].rstrip()
+        if key:
+            values[key] = val
+    for key, val in values.items():
+        os.environ.setdefault(key, val)
+
+# .env never overrides real env vars, so once this same file is loaded (this
+# process, or a parent we were spawned from) re-parsing it changes nothing.
+# Keyed by path: a child from another instance folder still loads its own.
+_ENV_SENTINEL = "PIPELINE_ENV_LOADED"
+_ENV_FILE     = (PROJECT_ROOT / ".env").resolve()
+if os.environ.get(_ENV_SENTINEL) != str(_ENV_FILE):
+    _load_env(_ENV_FILE)
+    os.environ[_ENV_SENTINEL] = str(_ENV_FILE)
+
+@functools.lru_cache(maxsize=None)
 def _get(key: str, default: str = "") -> str:
+    """Env lookup, read + stripped once per process (_get.cache_clear() after env changes)."""
     return os.getenv(key, default).strip()
 
 def _get_bool(key: str, default: bool = False) -> bool:
-    return _get(key, str(default)).lower() in ("true", "1", "yes")
+    v = _get(key)
+    if not v:                                         # missing / blank → default as-is
+        return default
+    return v.lower() in ("true", "1", "yes")
 
 def _get_int(key: str, default: int = 0) -> int:
+    v = _get(key)
+    if not v:
+        return default
     try:
-        return int(_get(key, str(default)))
+        return int(v)
     except ValueError:
         return default
 
+def _freeze(obj):
+    """Read-only view for constant settings: dict → MappingProxyType, list → tuple."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
 
 # ── Identity ──────────────────────────────────────────
 # Change this per instance (tech_hindi / english_news / sci_fi / hacker_news)
@@ -35,77 +104,113 @@ INSTANCE_DISPLAY: str = _get("INSTANCE_DISPLAY", "Tech Hindi")  # For Telegram m
 DATA_DIR       = PROJECT_ROOT / "data"
 LOGS_DIR       = PROJECT_ROOT / "logs"
 MEDIA_DIR      = PROJECT_ROOT / "media"
-DB_PATH        = DATA_DIR / f"{INSTANCE_NAME}.db"          # SQLite
-CHROMA_DIR     = DATA_DIR / f"{INSTANCE_NAME}_chroma"      # ChromaDB
+# Plain str where consumers (sqlite3, chromadb, logging) only want a string
+DB_PATH        = os.path.join(DATA_DIR, f"{INSTANCE_NAME}.db")          # SQLite
+CHROMA_DIR     = os.path.join(DATA_DIR, f"{INSTANCE_NAME}_chroma")      # ChromaDB
 DUMMY_IMAGE    = MEDIA_DIR / "dummy.jpg"                   # Fallback post image
-ROTATION_FILE  = DATA_DIR / f"{INSTANCE_NAME}_rotation.json"  # Backup
+ROTATION_FILE  = os.path.join(DATA_DIR, f"{INSTANCE_NAME}_rotation.json")  # Backup
 
-for _d in [DATA_DIR, LOGS_DIR, MEDIA_DIR, MEDIA_DIR / "generated"]:
-    _d.mkdir(exist_ok=True)
+# Warm starts: one stat per dir, mkdir only when missing
+_NEEDED_DIRS = (DATA_DIR, LOGS_DIR, MEDIA_DIR, MEDIA_DIR / "generated")
+for _d in _NEEDED_DIRS:
+    if not os.path.isdir(_d):
+        os.makedirs(_d, exist_ok=True)
 
 
 # ── RSS Feeds ─────────────────────────────────────────
-RSS_FEEDS = [
-    # INDIA: WELFARE & POLITICS
-    "https://news.google.com/rss/search?q=india+government+schemes&hl=en-IN&gl=IN&ceid=IN:en",
-    "https://www.thehindu.com/news/national/?service=rss",
-    "https://feeds.feedburner.com/ndtvnews-top-stories",
-    # FINANCE & MARKETS
-    "https://www.livemint.com/rss/money",
-    "https://economictimes.indiatimes.com/rssfeeds/1286551815.cms",
-    # TECHNOLOGY
-    "https://techcrunch.com/feed/",
-    "https://www.theverge.com/rss/index.xml",
-    "https://www.sciencedaily.com/rss/top/technology.xml",
-    # WORLD & GEOPOLITICS
-    "https://feeds.bbci.co.uk/news/world/rss.xml",
-    "https://www.aljazeera.com/xml/rss/all.xml",
-    "https://news.google.com/rss/search?q=geopolitics+war+defense&hl=en-US&gl=US&ceid=US:en",
-]
+def _build_rss_feeds() -> tuple:
+    return _freeze([
+        # INDIA: WELFARE & POLITICS
+        "https://news.google.com/rss/search?q=india+government+schemes&hl=en-IN&gl=IN&ceid=IN:en",
+        "https://www.thehindu.com/news/national/?service=rss",
+        "https://feeds.feedburner.com/ndtvnews-top-stories",
+        # FINANCE & MARKETS
+        "https://www.livemint.com/rss/money",
+        "https://economictimes.indiatimes.com/rssfeeds/1286551815.cms",
+        # TECHNOLOGY
+        "https://techcrunch.com/feed/",
+        "https://www.theverge.com/rss/index.xml",
+        "https://www.sciencedaily.com/rss/top/technology.xml",
+        # WORLD & GEOPOLITICS
+        "https://feeds.bbci.co.uk/news/world/rss.xml",
+        "https://www.aljazeera.com/xml/rss/all.xml",
+        "https://news.google.com/rss/search?q=geopolitics+war+defense&hl=en-US&gl=US&ceid=US:en",
+    ])
 
 
 # ── Category Anchors (Semantic Targets) ───────────────
-CATEGORY_ANCHORS = {
-    "WELFARE": {
-        "desc": "Indian government schemes, subsidies, ration cards, aadhaar, free grain, farmers welfare, women empowerment, pension schemes, PM Kisan, Awas Yojana.",
-        "weight": 14.0,
-        "priority": 1,
-    },
-    "ALERTS": {
-        "desc": "Urgent security warning, cyber crime, banking fraud, OTP scams, deepfake, malware, phishing, ransomware, police alert, data breach.",
-        "weight": 10.0,
-        "priority": 2,
-    },
-    "WAR_GEO": {
-        "desc": "International war, missile attacks, defense military, Russia Ukraine conflict, Israel Gaza Hamas, geopolitics, nuclear threat, NATO operations.",
-        "weight": 9.0,
-        "priority": 3,
-    },
-    "POLITICS": {
-        "desc": "Parliament session, election results, BJP Congress political news, prime minister speech, new laws passed, court decisions.",
-        "weight": 8.0,
-        "priority": 4,
-    },
-    "FINANCE": {
-        "desc": "Stock market crash, RBI repo rate, inflation data, GST tax news, gold price, home loan interest, economy GDP, job recruitment.",
-        "weight": 7.0,
-        "priority": 5,
-    },
-    "TECH_SCI": {
-        "desc": "Artificial intelligence breakthrough, space exploration, ISRO NASA launch, new scientific discovery, future technology, robotics, quantum computing.",
-        "weight": 6.0,
-        "priority": 6,
-    },
-    "NOISE": {
-        "desc": "Horoscope, zodiac signs, celebrity gossip, dating tips, fashion wardrobe, movie box office collection, cricket match score, viral video.",
-        "weight": -100.0,
-        "priority": 99,
-    },
-}
+def _build_category_anchors() -> MappingProxyType:
+    return _freeze({
+        "WELFARE": {
+            "desc": "Indian government schemes, subsidies, ration cards, aadhaar, free grain, farmers welfare, women empowerment, pension schemes, PM Kisan, Awas Yojana.",
+            "weight": 14.0,
+            "priority": 1,
+        },
+        "ALERTS": {
+            "desc": "Urgent security warning, cyber crime, banking fraud, OTP scams, deepfake, malware, phishing, ransomware, police alert, data breach.",
+            "weight": 10.0,
+            "priority": 2,
+        },
+        "WAR_GEO": {
+            "desc": "International war, missile attacks, defense military, Russia Ukraine conflict, Israel Gaza Hamas, geopolitics, nuclear threat, NATO operations.",
+            "weight": 9.0,
+            "priority": 3,
+        },
+        "POLITICS": {
+            "desc": "Parliament session, election results, BJP Congress political news, prime minister speech, new laws passed, court decisions.",
+            "weight": 8.0,
+            "priority": 4,
+        },
+        "FINANCE": {
+            "desc": "Stock market crash, RBI repo rate, inflation data, GST tax news, gold price, home loan interest, economy GDP, job recruitment.",
+            "weight": 7.0,
+            "priority": 5,
+        },
+        "TECH_SCI": {
+            "desc": "Artificial intelligence breakthrough, space exploration, ISRO NASA launch, new scientific discovery, future technology, robotics, quantum computing.",
+            "weight": 6.0,
+            "priority": 6,
+        },
+        "NOISE": {
+            "desc": "Horoscope, zodiac signs, celebrity gossip, dating tips, fashion wardrobe, movie box office collection, cricket match score, viral video.",
+            "weight": -100.0,
+            "priority": 99,
+        },
+    })
+
+
+def _section(name: str):
+    """Module attribute lookup from inside a builder (builds it if still lazy)."""
+    return getattr(sys.modules[__name__], name)
+
+
+# Parallel views of CATEGORY_ANCHORS (same row order) for vectorized scoring
+def _build_category_names() -> tuple:
+    return tuple(_section("CATEGORY_ANCHORS"))
+
+
+def _build_category_descs() -> tuple:
+    anchors = _section("CATEGORY_ANCHORS")
+    return tuple(anchors[c]["desc"] for c in anchors)
+
+
+def _build_category_weights():
+    import numpy as np
+    anchors = _section("CATEGORY_ANCHORS")
+    weights = np.array([anchors[c]["weight"] for c in anchors], dtype=np.float32)
+    weights.setflags(write=False)
+    return weights
+
+
+# Selection order: real categories sorted by priority (NOISE excluded)
+def _build_category_priority_order() -> tuple:
+    anchors = _section("CATEGORY_ANCHORS")
+    return tuple(sorted((c for c in anchors if c != "NOISE"),
+                        key=lambda c: anchors[c]["priority"]))
 
 
 # ── Regex Fallback Patterns ───────────────────────────
-REGEX_FALLBACK = {
+_REGEX_FALLBACK_RAW = {
     "WELFARE": [
         r"\bpm\s?kisan\b", r"\bawas\s?yojana\b", r"\bration\s?card\b",
         r"\bsubsidy\b", r"\bpension\b", r"\baadhaar\b", r"\bpan\s?card\b",
@@ -141,14 +246,69 @@ REGEX_FALLBACK = {
     ],
 }
 
+# Compiled once at import — consumers call pat.search(text); .pattern keeps the source
+def _build_regex_fallback() -> MappingProxyType:
+    return _freeze({
+        cat: [_icompile(p) for p in pats]
+        for cat, pats in _REGEX_FALLBACK_RAW.items()
+    })
+
+
+# One alternation per category (single scan); group p<i> = pattern index,
+# so m.lastgroup tells which pattern hit
+def _build_regex_fallback_combined() -> dict:
+    return {
+        cat: _icompile("|".join(f"(?P<p{i}>{p})" for i, p in enumerate(pats)))
+        for cat, pats in _REGEX_FALLBACK_RAW.items()
+    }
+
+
+def _required_literal(pattern: str):
+    """
+    Longest literal every match of pattern must contain (lowercase), or None
+    if the pattern has other regex syntax. Feeds the Aho–Corasick prefilter.
+    """
+    parts = re.split(r"\\s[?+*]", pattern.replace(r"\b", ""))
+    best  = max(parts, key=len)
+    return best.lower() if best and re.fullmatch(r"[\w ]+", best) else None
+
+
+# Per category, one required literal per pattern (None = always run regex)
+def _build_regex_fallback_literals() -> dict:
+    return {
+        cat: [_required_literal(p) for p in pats]
+        for cat, pats in _REGEX_FALLBACK_RAW.items()
+    }
+
+
+# Union over every category; group <CAT>_<i> → category + pattern in one match
+def _build_regex_fallback_tagged():
+    return _icompile(
+        "|".join(f"(?P<{cat}_{i}>{p})"
+                 for cat, pats in _REGEX_FALLBACK_RAW.items()
+                 for i, p in enumerate(pats))
+    )
+
 
 # ── Local AI Config ───────────────────────────────────
 LOCAL_AI_CONFIG = {
     "primary_model":    "all-MiniLM-L6-v2",   # 384-dim, fast, ~80MB
     "fallback_model":   "all-mpnet-base-v2",   # 768-dim, better accuracy
     "batch_size":       32,
+    # (max_words, batch_size) — None = open-ended; short buckets batch wider
+    "length_buckets":   [(16, 128), (32, 64), (64, 32), (None, 32)],
     "show_progress":    False,
+    "embedding_dtype":  "float16",             # in-memory anchor/article buffers
+    "use_numba":        False,                 # force Numba cosine kernel (auto if no BLAS)
+    "use_ct2":          True,                  # int8 CTranslate2 encoder if installed
+    "device":           "cpu",                 # cpu | cuda
     "similarity_threshold": 0.85,              # Same-day topic dedup threshold
+    # Persistent text → embedding cache (None disables)
+    "embedding_cache":  os.path.join(DATA_DIR, f"{INSTANCE_NAME}_emb_cache.db"),
+    # Static anchor vectors (reloaded while CATEGORY_ANCHORS descs match)
+    "anchor_cache_path": os.path.join(DATA_DIR, f"{INSTANCE_NAME}_anchors.npz"),
+    # Serialized Hyperscan DB for the regex fallback (rebuilt when patterns change)
+    "hs_cache_path":    os.path.join(DATA_DIR, f"{INSTANCE_NAME}_fallback_hs.db"),
 }
 
 
@@ -157,23 +317,26 @@ T_ARTICLES   = f"{INSTANCE_NAME}_articles"
 T_ROTATION   = f"{INSTANCE_NAME}_rotation"
 T_PUBLISH    = f"{INSTANCE_NAME}_publish_log"
 T_APPROVAL   = f"{INSTANCE_NAME}_approval_queue"
+T_FEED_CACHE = f"{INSTANCE_NAME}_feed_cache"
 
 # ChromaDB collection name
 CHROMA_COLLECTION = f"{INSTANCE_NAME}_articles"
 
 
 # ── Pipeline Settings ─────────────────────────────────
-PIPELINE = {
+PIPELINE = _freeze({
     "articles_per_run":    4,       # Articles selected per run
     "top_per_category":    25,      # Candidate pool per category
     "min_score":           0.0,     # Minimum score to consider
     "skip_noise":          True,
     "max_feed_workers":    4,       # Parallel RSS fetch threads
+    "feed_timeout_sec":    15,      # Per-feed HTTP timeout
+    "conditional_fetch":   True,    # Live runs send ETag/Last-Modified, skip 304s
     "max_age_hours":       48,      # Ignore articles older than this
-}
+})
 
 # Run schedule (24h format, local time) - 5 times/day
-SCHEDULE_TIMES = ["07:00", "10:00", "13:00", "16:30", "19:00"]
+SCHEDULE_TIMES = ("07:00", "10:00", "13:00", "16:30", "19:00")
 
 
 # ── Mode Flags ────────────────────────────────────────
@@ -183,19 +346,24 @@ AUTO_APPROVE: bool = _get_bool("AUTO_APPROVE", False)   # Skip Telegram approval
 APPROVAL_TIMEOUT_SEC: int = _get_int("APPROVAL_TIMEOUT_SEC", 300)  # 5 min default
 
 # Structured approval config (used by poster.py + blogger.py)
-APPROVAL = {
+APPROVAL = _freeze({
     "timeout_sec":       _get_int("APPROVAL_TIMEOUT_SEC", 300),
     "send_delay_sec":    4,    # gap between sending each TG approval message
     "poll_interval_sec": 30,   # sleep chunk between each poll sweep
     "post_delay_base":   _get_int("POST_DELAY_BASE_SEC", 30),   # between platform posts
     "post_delay_jitter": _get_int("POST_DELAY_JITTER_SEC", 60), # random added on top
-}
+})
 
 
 # ── Platform Toggles ──────────────────────────────────
-ENABLED_PLATFORMS: list = [
-    p.strip() for p in _get("ENABLED_PLATFORMS", "telegram,facebook").split(",") if p.strip()
-]
+# Ordered (posting order), de-duplicated; interned like the "telegram"/... literals
+# they're compared against (env-split strings aren't interned automatically)
+ENABLED_PLATFORMS: tuple = tuple(dict.fromkeys(
+    sys.intern(p.strip())
+    for p in _get("ENABLED_PLATFORMS", "telegram,facebook").split(",") if p.strip()
+))
+# O(1) membership checks ("facebook" in ENABLED_PLATFORM_SET)
+ENABLED_PLATFORM_SET: frozenset = frozenset(ENABLED_PLATFORMS)
 # Possible values: telegram, facebook, instagram, twitter, youtube
 
 
@@ -230,137 +398,211 @@ YOUTUBE_REFRESH_TOKEN: str = _get("YOUTUBE_REFRESH_TOKEN")
 
 # ── Logging ───────────────────────────────────────────
 LOG_LEVEL:  str = _get("LOG_LEVEL", "INFO")
-LOG_FILE:   Path = LOGS_DIR / f"{INSTANCE_NAME}.log"
+LOG_FILE:   str = os.path.join(LOGS_DIR, f"{INSTANCE_NAME}.log")
 
 
 # ── Rate Limits ───────────────────────────────────────
-RATE_LIMITS = {
-    "facebook":  {"requests_per_hour": 200, "retry_attempts": 3, "backoff_base": 2.0},
-    "instagram": {"requests_per_hour": 200, "retry_attempts": 3, "backoff_base": 2.0},
-    "twitter":   {"requests_per_hour": 300, "retry_attempts": 3, "backoff_base": 2.0},
-    "youtube":   {"requests_per_hour": 100, "retry_attempts": 2, "backoff_base": 3.0},
-    "telegram":  {"requests_per_hour": 3000, "retry_attempts": 3, "backoff_base": 1.5},
-}
+def _build_rate_limits() -> MappingProxyType:
+    return _freeze({
+        "facebook":  {"requests_per_hour": 200, "retry_attempts": 3, "backoff_base": 2.0},
+        "instagram": {"requests_per_hour": 200, "retry_attempts": 3, "backoff_base": 2.0},
+        "twitter":   {"requests_per_hour": 300, "retry_attempts": 3, "backoff_base": 2.0},
+        "youtube":   {"requests_per_hour": 100, "retry_attempts": 2, "backoff_base": 3.0},
+        "telegram":  {"requests_per_hour": 3000, "retry_attempts": 3, "backoff_base": 1.5},
+    })
 
 
 # ── Blog / AI Writer Config ───────────────────────────
 BLOG_ENABLED: bool = _get_bool("BLOG_ENABLED", False)
 
+
 # AI provider priority order — first available & not rate-limited wins
-AI_PROVIDERS = [
-    {
-        "name":    "gemini",
-        "api_key": _get("GEMINI_API_KEY"),
-        "model":   _get("GEMINI_MODEL", "gemini-1.5-flash"),
-        "enabled": bool(_get("GEMINI_API_KEY")),
-    },
-    {
-        "name":    "groq",
-        "api_key": _get("GROQ_API_KEY"),
-        "model":   _get("GROQ_MODEL", "llama-3.1-70b-versatile"),
-        "enabled": bool(_get("GROQ_API_KEY")),
-    },
-    {
-        "name":    "grok",
-        "api_key": _get("GROK_API_KEY"),
-        "model":   _get("GROK_MODEL", "grok-beta"),
-        "enabled": bool(_get("GROK_API_KEY")),
-    },
-    {
-        "name":    "free",                              # Pollinations text (no key)
-        "api_key": "",
-        "model":   "openai",
-        "enabled": True,
-    },
-]
+# Disabled providers (no key) are dropped here, so callers never re-check "enabled"
+def _build_ai_providers() -> tuple:
+    candidates = (
+        {
+            "name":    "gemini",
+            "api_key": _get("GEMINI_API_KEY"),
+            "model":   _get("GEMINI_MODEL", "gemini-1.5-flash"),
+            "enabled": bool(_get("GEMINI_API_KEY")),
+        },
+        {
+            "name":    "groq",
+            "api_key": _get("GROQ_API_KEY"),
+            "model":   _get("GROQ_MODEL", "llama-3.1-70b-versatile"),
+            "enabled": bool(_get("GROQ_API_KEY")),
+        },
+        {
+            "name":    "grok",
+            "api_key": _get("GROK_API_KEY"),
+            "model":   _get("GROK_MODEL", "grok-beta"),
+            "enabled": bool(_get("GROK_API_KEY")),
+        },
+        {
+            "name":    "free",                              # Pollinations text (no key)
+            "api_key": "",
+            "model":   "openai",
+            "enabled": True,
+        },
+    )
+    return tuple(MappingProxyType(p) for p in candidates if p["enabled"])
+
 
 # WordPress (per instance — each niche has its own WP site)
 # WP_URL can be:
 #   https://myblog.com              → REST API used  (/wp-json/wp/v2)
 #   https://myblog.com/graphql      → GraphQL used   (WPGraphQL plugin)
-_wp_url_raw = _get("WP_URL")
-_wp_base    = _wp_url_raw.replace("/graphql", "").rstrip("/") if _wp_url_raw else ""
-_wp_graphql = _wp_url_raw if "graphql" in _wp_url_raw.lower() else ""
-
-WORDPRESS = {
-    "url":            _wp_url_raw,                      # as-is from .env
-    "base_url":       _wp_base,                         # site root (no /graphql)
-    "graphql_url":    _wp_graphql or "",                # non-empty = use GraphQL
-    "use_graphql":    bool(_wp_graphql),
-    "username":       _get("WP_USERNAME"),
-    "app_password":   _get("WP_APP_PASSWORD"),
-    "default_status": _get("WP_POST_STATUS", "draft"),  # draft | publish
-    "author_id":      _get_int("WP_AUTHOR_ID", 1),
-}
+def _build_wordpress() -> dict:
+    wp_url_raw = _get("WP_URL")
+    wp_trimmed = wp_url_raw.rstrip("/")
+    is_graphql = wp_trimmed.lower().endswith("/graphql")      # one lowercase pass
+    wp_base    = (wp_trimmed[:-8] if is_graphql else wp_trimmed).rstrip("/")
+    wp_graphql = wp_url_raw if is_graphql else ""
+
+    return {
+        "url":            wp_url_raw,                       # as-is from .env
+        "base_url":       wp_base,                          # site root (no /graphql)
+        "graphql_url":    wp_graphql or "",                 # non-empty = use GraphQL
+        "use_graphql":    bool(wp_graphql),
+        "username":       _get("WP_USERNAME"),
+        "app_password":   _get("WP_APP_PASSWORD"),
+        "default_status": _get("WP_POST_STATUS", "draft"),  # draft | publish
+        "author_id":      _get_int("WP_AUTHOR_ID", 1),
+    }
+
 
 # Image generation
-IMAGE_GEN = {
-    "provider":    "pollinations",
-    "base_url":    "https://image.pollinations.ai/prompt/",
-    "api_key":     _get("POLLINATIONS_API_KEY"),        # optional paid key
-    "width":       1200,
-    "height":      630,
-    "model":       _get("POLLINATIONS_MODEL", "flux"),
-    "save_dir":    MEDIA_DIR / "generated",
-    "timeout_sec": 60,
-}
+def _build_image_gen() -> dict:
+    return {
+        "provider":    "pollinations",
+        "base_url":    "https://image.pollinations.ai/prompt/",
+        "api_key":     _get("POLLINATIONS_API_KEY"),        # optional paid key
+        "width":       1200,
+        "height":      630,
+        "model":       _get("POLLINATIONS_MODEL", "flux"),
+        "save_dir":    MEDIA_DIR / "generated",
+        "timeout_sec": 60,
+        "max_concurrency": 8,                               # pooled connections to Pollinations
+    }
+
 
 # Blog generation settings
-BLOG_CONFIG = {
-    # Content fetch
-    "fetch_timeout_sec":    15,
-    "max_content_chars":    8000,                      # truncate before sending to AI
-    "user_agent":           "Mozilla/5.0 (compatible; NewsBlogBot/1.0)",
-
-    # AI prompt
-    "min_word_count":       600,
-    "max_word_count":       1200,
-    "language":             _get("BLOG_LANGUAGE", "English"),
-    "tone":                 _get("BLOG_TONE", "informative, friendly, SEO-optimized"),
-
-    # Approval
-    "approval_timeout_sec": 600,                       # 10 min for blog (longer than news)
-    "approval_poll_sec":    10,                        # check every 10s (not 2s)
-
-    # Rate limit tracking file (per instance)
-    "rate_limit_file":      DATA_DIR / f"{INSTANCE_NAME}_ai_rate_limits.json",
+def _build_blog_config() -> dict:
+    return {
+        # Content fetch
+        "fetch_timeout_sec":    15,
+        "fetch_memo_ttl_sec":   600,                       # reuse a URL's fetch within a run
+        "max_content_chars":    8000,                      # truncate before sending to AI
+        "user_agent":           "Mozilla/5.0 (compatible; NewsBlogBot/1.0)",
+        # ETag / Last-Modified validators + parsed text per URL (conditional GET)
+        "content_cache_dir":    DATA_DIR / f"{INSTANCE_NAME}_content_cache",
+        "content_cache_max_age_days": 14,                  # prune entries older than this
+        "content_cache_max_entries":  5000,                # then keep only the newest N
+
+        # AI prompt
+        "min_word_count":       600,
+        "max_word_count":       1200,
+        "language":             _get("BLOG_LANGUAGE", "English"),
+        "tone":                 _get("BLOG_TONE", "informative, friendly, SEO-optimized"),
+
+        # Approval
+        "approval_timeout_sec": 600,                       # 10 min for blog (longer than news)
+        "approval_poll_sec":    10,                        # check every 10s (not 2s)
+
+        # Concurrency (Phase 1: fetch → AI → image per article)
+        "concurrency":          _get_int("BLOG_CONCURRENCY", 5),   # articles in flight
+        "ai_concurrency":       2,                         # AI calls in flight
+        "use_numba":            False,                     # JIT content_fetcher._clean letter counts
+
+        # Race all available AI providers concurrently, keep first valid post
+        # (lower tail latency, spends quota on every provider)
+        "speculative":          _get_bool("BLOG_SPECULATIVE", False),
+
+        # Rate limit tracking file (per instance)
+        "rate_limit_file":      DATA_DIR / f"{INSTANCE_NAME}_ai_rate_limits.json",
+    }
+
+
+# ── Lazy settings (PEP 562) ───────────────────────────
+# Heavy dicts / compiled regexes are built on first access and then cached
+# as plain module globals, so e.g. a health check only pays for env reads.
+_LAZY = {
+    "RSS_FEEDS":               _build_rss_feeds,
+    "CATEGORY_ANCHORS":        _build_category_anchors,
+    "CATEGORY_NAMES":          _build_category_names,
+    "CATEGORY_DESCS":          _build_category_descs,
+    "CATEGORY_WEIGHTS":        _build_category_weights,
+    "CATEGORY_PRIORITY_ORDER": _build_category_priority_order,
+    "REGEX_FALLBACK":          _build_regex_fallback,
+    "REGEX_FALLBACK_COMBINED": _build_regex_fallback_combined,
+    "REGEX_FALLBACK_LITERALS": _build_regex_fallback_literals,
+    "REGEX_FALLBACK_TAGGED":   _build_regex_fallback_tagged,
+    "RATE_LIMITS":             _build_rate_limits,
+    "AI_PROVIDERS":            _build_ai_providers,
+    "WORDPRESS":               _build_wordpress,
+    "IMAGE_GEN":               _build_image_gen,
+    "BLOG_CONFIG":             _build_blog_config,
 }
 
 
+def __getattr__(name: str):
+    build = _LAZY.get(name)
+    if build is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = build()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def warm():
+    """Materialize every lazy section + validate() up front (long-lived services)."""
+    for name in _LAZY:
+        _section(name)
+    validate()
+
+
 # ── Validation ────────────────────────────────────────
-def validate() -> list[str]:
-    """Return list of config problems. Empty = all good."""
+@functools.lru_cache(maxsize=1)
+def validate() -> tuple[str, ...]:
+    """
+    Return config problems. Empty = all good.
+    Settings are fixed per process, so the result is cached
+    (validate.cache_clear() after hot-reloading env / config).
+    """
     problems = []
 
     if not INSTANCE_NAME:
         problems.append("INSTANCE_NAME is required")
 
-    if "telegram" in ENABLED_PLATFORMS:
+    if "telegram" in ENABLED_PLATFORM_SET:
         if not TELEGRAM_BOT_TOKEN:
             problems.append("TELEGRAM_BOT_TOKEN missing")
         if not TELEGRAM_CHAT_ID:
             problems.append("TELEGRAM_CHAT_ID missing")
 
-    if "facebook" in ENABLED_PLATFORMS:
+    if "facebook" in ENABLED_PLATFORM_SET:
         if not FACEBOOK_PAGE_ID:
             problems.append("FACEBOOK_PAGE_ID missing")
         if not FACEBOOK_ACCESS_TOKEN:
             problems.append("FACEBOOK_ACCESS_TOKEN missing")
 
-    if "instagram" in ENABLED_PLATFORMS:
+    if "instagram" in ENABLED_PLATFORM_SET:
         if not INSTAGRAM_ACCOUNT_ID:
             problems.append("INSTAGRAM_ACCOUNT_ID missing")
         if not INSTAGRAM_ACCESS_TOKEN:
             problems.append("INSTAGRAM_ACCESS_TOKEN missing")
 
-    if "twitter" in ENABLED_PLATFORMS:
+    if "twitter" in ENABLED_PLATFORM_SET:
         missing = [k for k in ["TWITTER_API_KEY", "TWITTER_API_SECRET",
                                 "TWITTER_ACCESS_TOKEN", "TWITTER_ACCESS_SECRET"]
                    if not _get(k)]
         if missing:
             problems.append(f"Twitter missing: {', '.join(missing)}")
 
-    return problems
+    return tuple(problems)
 
 
 def print_status():
@@ -8,16 +8,35 @@ Edge cases handled:
 - JS-heavy pages (empty body)  → fallback to summary
 - Bad encoding                 → auto-detect
 - Redirects                    → followed automatically
-- Missing BeautifulSoup        → regex strip fallback
+- Missing BeautifulSoup        → regex strip fallback (selectolax preferred if installed)
+- Re-fetch of a known URL       → conditional GET, 304 reuses cached text
+- Same URL again within a run   → in-memory result reused (short TTL, no network)
 """
+import functools
+import hashlib
+import json
 import re
 import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
 from urllib.parse import urlparse
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
+try:
+    # Optional: C HTML parser, much faster than BeautifulSoup on large pages
+    from selectolax.lexbor import LexborHTMLParser as _FastHTML
+except ImportError:
+    _FastHTML = None
+
 log = logging.getLogger("content_fetcher")
 
 HEADERS = {
@@ -25,8 +44,39 @@ HEADERS = {
     "Accept":          "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.5",
     "Accept-Encoding": "gzip, deflate",
+    "Connection":      "keep-alive",
 }
 
+# Shared keep-alive session — pooled per host across fetches. Transient 5xx
+# get a short retry; the final response still goes through the soft-fail path.
+_session = requests.Session()
+_session.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=32, pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=[502, 503, 504], raise_on_status=False),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+_CACHE_DIR = Path(config.BLOG_CONFIG["content_cache_dir"])
+_CACHE_PRUNE_EVERY = 3600.0          # sweep the cache dir at most hourly
+_cache_pruned_at   = None
+_CACHE_PRUNE_LOCK  = threading.Lock()
+
+_NOISE_TAGS = ("script", "style", "nav", "header", "footer", "aside", "form",
+               "iframe", "noscript", "figure", "figcaption")
+# Matched against class attributes (ads, share bars, related links, ...)
+_NOISE_RE = re.compile(
+    r"ad|banner|sidebar|related|comment|share|social|cookie|popup", re.I)
+_BODY_CLASS_RE = re.compile(r"article|post-content|entry|story", re.I)
+_TAG_RE        = re.compile(r"<[^>]+>")                # no-BS4 fallback
+
+# Recent successful fetches: url → (monotonic time, FetchResult)
+_MEMO: dict = {}
+_MEMO_LOCK = threading.Lock()
+_MEMO_MAX  = 256
+
 # Known paywalled domains — skip fetch, use summary only
 _BLOCKED = {
     "wsj.com", "ft.com", "bloomberg.com", "nytimes.com",
@@ -59,30 +109,50 @@ def fetch(url: str, fallback_summary: str = "") -> FetchResult:
     if not url:
         return _fallback(url, fallback_summary, "No URL provided")
 
+    hit = _memo_get(url)
+    if hit is not None:
+        log.info(f"♻️  Already fetched this run — {url[:70]}")
+        return hit
+
     domain = _domain(url)
 
     if domain in _BLOCKED:
         log.info(f"⏭️  Blocked domain ({domain}) — using summary")
         return _fallback(url, fallback_summary, f"Blocked: {domain}")
 
+    cached  = _cache_load(url)
+    headers = None                       # session already carries HEADERS
+    if cached:
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        resp = requests.get(
+        resp = _session.get(
             url,
-            headers=HEADERS,
+            headers=headers,
             timeout=config.BLOG_CONFIG["fetch_timeout_sec"],
             allow_redirects=True,
         )
 
-        # Soft 4xx/5xx — don't raise, just fallback
-        if resp.status_code >= 400:
-            log.warning(f"HTTP {resp.status_code} for {url[:70]}")
-            return _fallback(url, fallback_summary, f"HTTP {resp.status_code}")
+        if resp.status_code == 304 and cached:
+            log.info(f"♻️  Not modified — cached content for {url[:70]}")
+            title, content = cached["title"], cached["content"]
+            _cache_touch(url)   # still live — keep it out of the age prune
+        else:
+            # Soft 4xx/5xx — don't raise, just fallback
+            if resp.status_code >= 400:
+                log.warning(f"HTTP {resp.status_code} for {url[:70]}")
+                return _fallback(url, fallback_summary, f"HTTP {resp.status_code}")
 
-        # Fix encoding if garbled
-        if resp.encoding and resp.encoding.lower() in ("iso-8859-1", "latin-1"):
-            resp.encoding = resp.apparent_encoding
+            # Fix encoding if garbled
+            if resp.encoding and resp.encoding.lower() in ("iso-8859-1", "latin-1"):
+                resp.encoding = resp.apparent_encoding
 
-        title, content = _parse(resp.text)
+            title, content = _parse(resp.text)
+            _cache_save(url, resp, title, content)
 
         # Too little content = JS-heavy or paywall
         if len(content) < 100:
@@ -97,7 +167,9 @@ def fetch(url: str, fallback_summary: str = "") -> FetchResult:
             content = content[:max_c] + "\n\n[Content truncated]"
 
         log.info(f"✅ Fetched {len(content)} chars from {domain}")
-        return FetchResult(url, title=title, content=content, source="fetch")
+        result = FetchResult(url, title=title, content=content, source="fetch")
+        _memo_put(url, result)
+        return result
 
     except requests.exceptions.Timeout:
         log.warning(f"⏱️  Timeout fetching {url[:70]}")
@@ -111,6 +183,90 @@ def fetch(url: str, fallback_summary: str = "") -> FetchResult:
 
 # ── Helpers ───────────────────────────────────────────
 
+def _memo_get(url: str) -> Optional[FetchResult]:
+    ttl = config.BLOG_CONFIG.get("fetch_memo_ttl_sec", 600)
+    with _MEMO_LOCK:
+        entry = _MEMO.get(url)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+    return None
+
+
+def _memo_put(url: str, result: FetchResult):
+    """Only real fetches are kept — fallbacks depend on the caller's summary."""
+    with _MEMO_LOCK:
+        _MEMO.pop(url, None)
+        _MEMO[url] = (time.monotonic(), result)
+        while len(_MEMO) > _MEMO_MAX:
+            _MEMO.pop(next(iter(_MEMO)))                   # oldest first
+
+
+def _cache_path(url: str) -> Path:
+    return _CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _cache_load(url: str) -> Optional[dict]:
+    """Cached validators + parsed text for url, or None."""
+    try:
+        return json.loads(_cache_path(url).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_touch(url: str):
+    try:
+        os.utime(_cache_path(url))
+    except OSError:
+        pass
+
+
+def _cache_save(url: str, resp, title: str, content: str):
+    """Keep parsed text only if the server gave us a validator to revalidate with."""
+    etag = resp.headers.get("ETag", "")
+    lm   = resp.headers.get("Last-Modified", "")
+    if not (etag or lm):
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(url).write_text(json.dumps({
+            "etag": etag, "last_modified": lm,
+            "title": title, "content": content,
+        }), encoding="utf-8")
+    except OSError as e:
+        log.debug(f"Content cache write failed: {e}")
+    _cache_maybe_prune()
+
+
+def _cache_maybe_prune():
+    """Drop entries past max age, then the oldest beyond max entries (hourly)."""
+    global _cache_pruned_at
+    now = time.monotonic()
+    with _CACHE_PRUNE_LOCK:
+        if _cache_pruned_at is not None and now - _cache_pruned_at < _CACHE_PRUNE_EVERY:
+            return
+        _cache_pruned_at = now
+
+    cfg     = config.BLOG_CONFIG
+    cutoff  = time.time() - cfg.get("content_cache_max_age_days", 14) * 86400
+    keep    = cfg.get("content_cache_max_entries", 5000)
+    entries = []
+    try:
+        for e in os.scandir(_CACHE_DIR):
+            if e.name.endswith(".json"):
+                entries.append((e.stat().st_mtime, e.path))
+    except OSError:
+        return
+    entries.sort(reverse=True)                      # newest first
+    stale = [p for i, (mtime, p) in enumerate(entries) if mtime < cutoff or i >= keep]
+    for p in stale:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+    if stale:
+        log.debug(f"Content cache pruned {len(stale)} entries")
+
+
 def _fallback(url: str, summary: str, reason: str) -> FetchResult:
     if summary:
         log.info(f"📝 Using summary fallback ({reason})")
@@ -119,43 +275,15 @@ def _fallback(url: str, summary: str, reason: str) -> FetchResult:
 
 
 def _parse(html: str) -> tuple[str, str]:
-    """Extract title + body text. Falls back to regex if no BS4."""
+    """Extract title + body text. selectolax → BS4 → regex, whichever is installed."""
     try:
-        from bs4 import BeautifulSoup, Tag
-
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Title
-        title = ""
-        if soup.title and soup.title.string:
-            title = soup.title.string.strip()
-        if not title:
-            h1 = soup.find("h1")
-            title = h1.get_text().strip() if h1 else ""
-
-        # Remove noise
-        for tag in soup(["script", "style", "nav", "header", "footer",
-                         "aside", "form", "iframe", "noscript",
-                         "figure", "figcaption"]):
-            tag.decompose()
-        for el in soup.find_all(class_=re.compile(
-                r"ad|banner|sidebar|related|comment|share|social|cookie|popup",
-                re.I)):
-            el.decompose()
-
-        # Best content element
-        body = (
-            soup.find("article") or
-            soup.find(attrs={"class": re.compile(r"article|post-content|entry|story", re.I)}) or
-            soup.find("main") or
-            soup.find("body")
-        )
-        raw = body.get_text(separator=" ") if body else soup.get_text()
-        return title, _clean(raw)
+        if _FastHTML is not None:
+            return _parse_fast(html)
+        return _parse_bs4(html)
 
     except ImportError:
         # No BeautifulSoup — regex fallback
-        content = re.sub(r"<[^>]+>", " ", html)
+        content = _TAG_RE.sub(" ", html)
         return "", _clean(content)
 
     except Exception as e:
@@ -163,20 +291,159 @@ def _parse(html: str) -> tuple[str, str]:
         return "", ""
 
 
-def _clean(text: str) -> str:
-    """Normalize whitespace, drop junk short lines."""
-    lines = []
-    for line in text.splitlines():
-        line = line.strip()
-        if len(line) < 25:
-            continue
-        alpha = sum(c.isalpha() for c in line) / max(len(line), 1)
-        if alpha < 0.35:
+def _parse_fast(html: str) -> tuple[str, str]:
+    """selectolax (C engine) — same rules as _parse_bs4."""
+    tree = _FastHTML(html)
+
+    # Title
+    node  = tree.css_first("title")
+    title = node.text(strip=True) if node else ""
+    if not title:
+        node  = tree.css_first("h1")
+        title = node.text(strip=True) if node else ""
+
+    # Remove noise
+    tree.strip_tags(list(_NOISE_TAGS))
+    # Match on the intact tree, then drop only the outermost matches —
+    # decomposing a parent frees its (already listed) descendants
+    doomed, tops = set(), []
+    for el in tree.css("[class]"):
+        if not _NOISE_RE.search(el.attributes.get("class") or ""):
             continue
-        lines.append(line)
-    return " ".join(lines)
+        p = el.parent
+        while p is not None and p.mem_id not in doomed:
+            p = p.parent
+        if p is None:
+            doomed.add(el.mem_id)
+            tops.append(el)
+    for el in tops:
+        el.decompose()
+
+    # Best content element
+    body = tree.css_first("article")
+    if body is None:
+        body = next((el for el in tree.css("[class]")
+                     if _BODY_CLASS_RE.search(el.attributes.get("class") or "")), None)
+    body = body or tree.css_first("main") or tree.body
+    raw  = body.text(separator=" ") if body else tree.text(separator=" ")
+    return title, _clean(raw)
+
+
+def _parse_bs4(html: str) -> tuple[str, str]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Title
+    title = ""
+    if soup.title and soup.title.string:
+        title = soup.title.string.strip()
+    if not title:
+        h1 = soup.find("h1")
+        title = h1.get_text().strip() if h1 else ""
+
+    # Remove noise
+    for tag in soup(list(_NOISE_TAGS)):
+        tag.decompose()
+    for el in soup.find_all(class_=_NOISE_RE):
+        el.decompose()
+
+    # Best content element
+    body = (
+        soup.find("article") or
+        soup.find(attrs={"class": _BODY_CLASS_RE}) or
+        soup.find("main") or
+        soup.find("body")
+    )
+    raw = body.get_text(separator=" ") if body else soup.get_text()
+    return title, _clean(raw)
+
+
+def _clean(text: str) -> str:
+    """Normalize whitespace, drop junk short lines (< 25 chars or < 35% letters)."""
+    # Raw length bounds the stripped one, so short lines skip strip() entirely
+    lines = [s for s in (ln.strip() for ln in text.splitlines() if len(ln) >= 25)
+             if len(s) >= 25]
+    if not lines:
+        return ""
+    if text.isascii():
+        # Pure ASCII: delete non-letters in C (bytes.translate), count the rest
+        return " ".join(ln for ln in lines
+                        if len(ln.encode().translate(None, _ASCII_NON_ALPHA)) / len(ln) >= 0.35)
+    ratio = _alpha_counts(lines) / np.fromiter(map(len, lines), np.float64, len(lines))
+    return " ".join(ln for ln, ok in zip(lines, (ratio >= 0.35).tolist()) if ok)
+
+
+_ASCII_NON_ALPHA = bytes(i for i in range(128) if not chr(i).isalpha())
+_ALPHA_LUT: Optional[np.ndarray] = None
+
+
+def _build_alpha_kernel():
+    """
+    JIT'd fused lookup + per-line sum (one pass, no temporaries) for very
+    large bodies. Returns None unless BLOG_CONFIG["use_numba"] and numba is
+    installed.
+    """
+    if not config.BLOG_CONFIG.get("use_numba"):
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _segment_alpha(cps, lut, starts, ends):
+        out = np.zeros(starts.shape[0], dtype=np.int64)
+        for i in range(starts.shape[0]):
+            n = 0
+            for k in range(starts[i], ends[i]):
+                c = cps[k]
+                if c <= 0xFFFF and lut[c]:
+                    n += 1
+            out[i] = n
+        return out
 
+    # Pay JIT compile once, at import
+    one = np.zeros(1, dtype=np.int64)
+    _segment_alpha(np.zeros(1, np.uint32), np.zeros(0x10000, np.bool_), one, one + 1)
+    log.info("✅ Numba text-filter kernel compiled")
+    return _segment_alpha
 
+
+_ALPHA_KERNEL = _build_alpha_kernel()
+
+
+def _alpha_counts(lines: List[str]) -> np.ndarray:
+    """
+    str.isalpha() count per line, vectorized: all lines as one UTF-32 code
+    point buffer → BMP lookup table → per-line segment sums. Unicode-aware
+    (Devanagari letters count, matras don't) exactly like str.isalpha.
+    """
+    global _ALPHA_LUT
+    if _ALPHA_LUT is None:
+        _ALPHA_LUT = np.fromiter((chr(i).isalpha() for i in range(0x10000)),
+                                 np.bool_, 0x10000)
+    cps    = np.frombuffer("".join(lines).encode("utf-32-le", "surrogatepass"),
+                           dtype=np.uint32)
+    starts = np.zeros(len(lines), dtype=np.int64)
+    np.cumsum([len(ln) for ln in lines[:-1]], out=starts[1:])
+
+    if _ALPHA_KERNEL is not None:
+        ends   = np.append(starts[1:], len(cps))
+        counts = _ALPHA_KERNEL(cps, _ALPHA_LUT, starts, ends)
+    else:
+        # U+FFFF is not a letter, so astral code points count 0 here too
+        flags  = _ALPHA_LUT[np.minimum(cps, 0xFFFF)].astype(np.int32)
+        counts = np.add.reduceat(flags, starts)           # every line is non-empty
+
+    astral = np.flatnonzero(cps > 0xFFFF)                 # rare: emoji etc.
+    if len(astral):
+        np.add.at(counts, np.searchsorted(starts, astral, "right") - 1,
+                  [chr(c).isalpha() for c in cps[astral].tolist()])
+    return counts
+
+
+@functools.lru_cache(maxsize=4096)
 def _domain(url: str) -> str:
     try:
         d = urlparse(url).netloc.lower()
@@ -1,6 +1,7 @@
 """
 db.py - Data layer.
-  SQLite  → articles, rotation state, publish log, approval queue
+  SQLite  → articles, rotation state, publish log, approval queue,
+            feed validators (ETag / Last-Modified)
   ChromaDB → embeddings + same-day topic similarity dedup
 
 STATUS FLOW:  pending → selected → published
@@ -9,8 +10,11 @@ STATUS FLOW:  pending → selected → published
 KEY FIX: get_diverse_top_picks() marks articles 'selected' immediately,
 so re-runs never re-pick the same articles even if posting was interrupted.
 """
+import atexit
+import hashlib
 import sqlite3
 import logging
+import threading
 from datetime import datetime, timezone, date
 from collections import defaultdict
 from contextlib import contextmanager
@@ -23,19 +27,70 @@ log = logging.getLogger(__name__)
 
 # ── SQLite helpers ────────────────────────────────────
 
+# Applied once per connection, not per call
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",         # WAL-safe; fsync at checkpoints only
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",        # 256 MB
+    "PRAGMA cache_size=-64000",          # ~64 MB page cache
+)
+
+# One long-lived connection per thread (re-opened if config.DB_PATH changes).
+# A worker thread's connection is closed when the thread-local is collected.
+_local = threading.local()
+
+
+def _open(path: str) -> sqlite3.Connection:
+    con = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    con.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        con.execute(pragma)
+    return con
+
+
+@atexit.register
+def _close():
+    con = getattr(_local, "con", None)
+    if con is not None:
+        _local.con = None
+        con.close()
+
+
 @contextmanager
 def _conn():
-    con = sqlite3.connect(config.DB_PATH, check_same_thread=False)
-    con.row_factory = sqlite3.Row
-    con.execute("PRAGMA journal_mode=WAL")
+    """
+    Transaction on this thread's cached connection: BEGIN … COMMIT, or
+    ROLLBACK on error. Nested use joins the outer transaction.
+    """
+    path = str(config.DB_PATH)
+    con  = getattr(_local, "con", None)
+    if con is None or _local.path != path:
+        if con is not None:
+            con.close()
+        con = _local.con = _open(path)
+        _local.path  = path
+        _local.depth = 0
+
+    if _local.depth:
+        _local.depth += 1
+        try:
+            yield con
+        finally:
+            _local.depth -= 1
+        return
+
+    _local.depth = 1
+    con.execute("BEGIN")
     try:
         yield con
-        con.commit()
-    except Exception:
-        con.rollback()
+        con.execute("COMMIT")
+    except BaseException:
+        if con.in_transaction:
+            con.execute("ROLLBACK")
         raise
     finally:
-        con.close()
+        _local.depth = 0
 
 
 def init_db():
@@ -60,9 +115,20 @@ def init_db():
         CREATE INDEX IF NOT EXISTS idx_{config.INSTANCE_NAME}_hash
         ON {config.T_ARTICLES}(content_hash)""")
 
+        # Partial + covering: get_diverse_top_picks reads pending rows per
+        # category straight from the index, no table lookups. Replaces the
+        # older (status, category, score) index, which the planner preferred.
+        con.execute(f"DROP INDEX IF EXISTS idx_{config.INSTANCE_NAME}_status_cat")
         con.execute(f"""
-        CREATE INDEX IF NOT EXISTS idx_{config.INSTANCE_NAME}_status_cat
-        ON {config.T_ARTICLES}(status, category, score DESC)""")
+        CREATE INDEX IF NOT EXISTS idx_{config.INSTANCE_NAME}_pending_pick
+        ON {config.T_ARTICLES}(category, score DESC, id, content_hash,
+                               title, link, summary, status)
+        WHERE status='pending'""")
+
+        # Plain status lookups for every other status (requeue, stats, …)
+        con.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{config.INSTANCE_NAME}_status
+        ON {config.T_ARTICLES}(status, category)""")
 
         con.execute(f"""
         CREATE TABLE IF NOT EXISTS {config.T_ROTATION} (
@@ -96,9 +162,46 @@ def init_db():
             updated_at TEXT
         )""")
 
+        con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {config.T_FEED_CACHE} (
+            url        TEXT PRIMARY KEY,
+            etag       TEXT,
+            modified   TEXT,
+            updated_at TEXT
+        )""")
+
+        if con.execute("PRAGMA user_version").fetchone()[0] < 1:
+            _migrate_hash_keys(con)
+            con.execute("PRAGMA user_version = 1")
+
     log.info(f"✅ SQLite ready: {config.DB_PATH}")
 
 
+def _migrate_hash_keys(con: sqlite3.Connection):
+    """
+    One-off: re-key rows stored before the BLAKE2b switch. The old key was
+    sha256(title + link) over the same stripped title and link the row
+    holds, so it is recomputed here and replaced with parser.RSSParser._hash's
+    key — articles still in the feeds then dedup against them as before.
+    """
+    rows = con.execute(
+        f"SELECT id, content_hash, title, link FROM {config.T_ARTICLES} "
+        "WHERE length(content_hash) = 64"
+    ).fetchall()
+    updates = []
+    for r in rows:
+        title, link = r["title"] or "", r["link"] or ""
+        if hashlib.sha256(f"{title}{link}".encode()).hexdigest() == r["content_hash"]:
+            new_key = hashlib.blake2b(f"{title}\x00{link}".encode(), digest_size=16).hexdigest()
+            updates.append((new_key, r["id"]))
+    if updates:
+        con.executemany(
+            f"UPDATE OR IGNORE {config.T_ARTICLES} SET content_hash=? WHERE id=?",
+            updates,
+        )
+        log.info(f"🔑 Re-keyed {len(updates)} articles to BLAKE2b content hashes")
+
+
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -109,11 +212,12 @@ def _today() -> str:
 
 # ── ChromaDB helpers ──────────────────────────────────
 
-_chroma_col = None
+_chroma_col     = None
+_chroma_missing = False      # import failed once → don't retry (or re-warn) per call
 
 def _get_chroma():
-    global _chroma_col
-    if _chroma_col is not None:
+    global _chroma_col, _chroma_missing
+    if _chroma_col is not None or _chroma_missing:
         return _chroma_col
     try:
         import chromadb
@@ -125,6 +229,7 @@ def _get_chroma():
         log.info(f"✅ ChromaDB ready: {config.CHROMA_DIR}")
         return _chroma_col
     except ImportError:
+        _chroma_missing = True
         log.warning("⚠️  chromadb not installed — vector dedup disabled")
         return None
     except Exception as e:
@@ -134,54 +239,101 @@ def _get_chroma():
 
 # ── Article operations ────────────────────────────────
 
+# Above this many hashes, probe via an indexed temp-table join instead of
+# one huge IN (?,?,...) (SQLite caps bound parameters; planner cost grows)
+_HASH_IN_LIMIT = 100
+
+
 def check_hash_exists(hashes: List[str]) -> set:
     if not hashes:
         return set()
-    placeholders = ",".join("?" * len(hashes))
     with _conn() as con:
+        return set(_hash_ids(con, hashes))
+
+
+def _hash_ids(con: sqlite3.Connection, hashes: List[str]) -> Dict[str, int]:
+    """content_hash → id for the hashes already in the articles table."""
+    if len(hashes) <= _HASH_IN_LIMIT:
+        placeholders = ",".join("?" * len(hashes))
         rows = con.execute(
-            f"SELECT content_hash FROM {config.T_ARTICLES} "
+            f"SELECT id, content_hash FROM {config.T_ARTICLES} "
             f"WHERE content_hash IN ({placeholders})",
             hashes,
         ).fetchall()
-    return {r["content_hash"] for r in rows}
+    else:
+        con.execute("CREATE TEMP TABLE IF NOT EXISTS _probe_hash (h TEXT PRIMARY KEY)")
+        con.execute("DELETE FROM _probe_hash")
+        con.executemany("INSERT OR IGNORE INTO _probe_hash VALUES (?)",
+                        ((h,) for h in hashes))
+        rows = con.execute(
+            f"SELECT a.id, a.content_hash FROM {config.T_ARTICLES} a "
+            f"JOIN _probe_hash p ON a.content_hash = p.h"
+        ).fetchall()
+    return {r["content_hash"]: r["id"] for r in rows}
 
 
-def is_similar_today(embedding: List[float], threshold: float = None) -> bool:
+def _as_list(embedding) -> List[float]:
+    """Chroma boundary: ndarray rows from ai.py → plain float list."""
+    return embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+
+
+def is_similar_today(embedding, threshold: float = None) -> bool:
     """Check if a similar article was already saved today (Chroma cosine check)."""
-    if embedding is None:
-        return False
+    return are_similar_today([embedding], threshold)[0]
+
+
+def are_similar_today(embeddings: list, threshold: float = None) -> List[bool]:
+    """
+    Batched is_similar_today — one Chroma query for every non-None embedding.
+    Returns a mask aligned with the input (None → False).
+    """
+    mask = [False] * len(embeddings)
+    idxs = [i for i, e in enumerate(embeddings) if e is not None]
+    if not idxs:
+        return mask
     col = _get_chroma()
     if col is None:
-        return False
+        return mask
     thr = threshold or config.LOCAL_AI_CONFIG["similarity_threshold"]
     try:
         results = col.query(
-            query_embeddings=[embedding],
+            query_embeddings=[_as_list(embeddings[i]) for i in idxs],
             n_results=1,
             where={"date": _today()},
             include=["distances"],
         )
-        if results["distances"] and results["distances"][0]:
-            similarity = 1.0 - results["distances"][0][0]
-            if similarity >= thr:
-                log.debug(f"🔁 Similar article today (sim={similarity:.3f})")
-                return True
+        for i, dists in zip(idxs, results["distances"] or []):
+            if dists and 1.0 - dists[0] >= thr:
+                log.debug(f"🔁 Similar article today (sim={1.0 - dists[0]:.3f})")
+                mask[i] = True
     except Exception as e:
         log.debug(f"Chroma query skipped: {e}")
-    return False
+    return mask
 
 
 def save_embedding(article_id: int, content_hash: str,
-                   embedding: List[float], category: str):
+                   embedding, category: str):
+    save_embeddings([(article_id, content_hash, embedding, category)])
+
+
+def save_embeddings(items: List[tuple]):
+    """
+    Batched save_embedding — one Chroma upsert.
+    items: (article_id, content_hash, embedding, category); None embeddings skipped.
+    """
+    items = [it for it in items if it[2] is not None]
+    if not items:
+        return
     col = _get_chroma()
-    if col is None or embedding is None:
+    if col is None:
         return
+    today = _today()
     try:
         col.upsert(
-            ids=[content_hash],
-            embeddings=[embedding],
-            metadatas=[{"date": _today(), "category": category, "db_id": article_id}],
+            ids=[h for _, h, _, _ in items],
+            embeddings=[_as_list(e) for _, _, e, _ in items],
+            metadatas=[{"date": today, "category": cat, "db_id": art_id}
+                       for art_id, _, _, cat in items],
         )
     except Exception as e:
         log.warning(f"⚠️  Chroma upsert failed: {e}")
@@ -203,41 +355,47 @@ def save_articles_batch(articles: List[Dict], skip_noise: bool = True) -> int:
         log.info("💤 All articles already exist in DB")
         return 0
 
-    saved = 0
+    # NOT NULL columns — one bad row would fail the whole batch
+    candidates = [a for a in new_arts if a.get("content_hash") and a.get("title")]
+    similar    = are_similar_today([a.get("embedding") for a in candidates])
+    to_insert  = []
+    for art, dup in zip(candidates, similar):
+        if dup:
+            log.debug(f"⏭️  Similar today: {art.get('title','')[:60]}")
+            continue
+        to_insert.append(art)
+
+    now = _now()
     with _conn() as con:
-        for art in new_arts:
-            if is_similar_today(art.get("embedding")):
-                log.debug(f"⏭️  Similar today: {art.get('title','')[:60]}")
-                continue
-            try:
-                cur = con.execute(
-                    f"""INSERT OR IGNORE INTO {config.T_ARTICLES}
-                    (content_hash, title, link, summary, category, score,
-                     status, source_feed, created_at)
-                    VALUES (?,?,?,?,?,?,?,?,?)""",
-                    (
-                        art.get("content_hash"),
-                        art.get("title"),
-                        art.get("link"),
-                        art.get("summary"),
-                        art.get("category", "GENERAL"),
-                        art.get("score", 0.0),
-                        "pending",
-                        art.get("source_feed"),
-                        _now(),
-                    ),
-                )
-                if cur.lastrowid:
-                    saved += 1
-                    art["_db_id"] = cur.lastrowid
-            except sqlite3.IntegrityError:
-                pass
-
-    for art in new_arts:
-        db_id = art.get("_db_id")
-        if db_id and art.get("embedding"):
-            save_embedding(db_id, art["content_hash"],
-                           art["embedding"], art.get("category", "GENERAL"))
+        before = con.total_changes
+        con.executemany(
+            f"""INSERT OR IGNORE INTO {config.T_ARTICLES}
+            (content_hash, title, link, summary, category, score,
+             status, source_feed, created_at)
+            VALUES (?,?,?,?,?,?,?,?,?)""",
+            [(
+                art.get("content_hash"),
+                art.get("title"),
+                art.get("link"),
+                art.get("summary"),
+                art.get("category", "GENERAL"),
+                art.get("score", 0.0),
+                "pending",
+                art.get("source_feed"),
+                now,
+            ) for art in to_insert],
+        )
+        saved = con.total_changes - before
+        ids   = _hash_ids(con, [a["content_hash"] for a in to_insert]) if saved else {}
+
+    emb_rows = []
+    for art in to_insert:
+        db_id = ids.get(art["content_hash"])
+        if db_id:
+            art["_db_id"] = db_id
+            emb_rows.append((db_id, art["content_hash"],
+                             art.get("embedding"), art.get("category", "GENERAL")))
+    save_embeddings(emb_rows)
 
     log.info(f"💾 Saved {saved}/{len(new_arts)} new articles to DB")
     return saved
@@ -293,23 +451,28 @@ def get_diverse_top_picks(
     - Only fresh 'pending' articles are ever selected
     """
     if priority_order is None:
-        priority_order = sorted(
-            [c for c in config.CATEGORY_ANCHORS if c != "NOISE"],
-            key=lambda x: config.CATEGORY_ANCHORS[x]["priority"],
-        )
+        priority_order = config.CATEGORY_PRIORITY_ORDER
 
     buckets: Dict[str, List[Dict]] = defaultdict(list)
 
+    # Top-N per category in one windowed query (was one SELECT per category)
+    cat_placeholders = ",".join("?" * len(priority_order))
     with _conn() as con:
-        for cat in priority_order:
-            rows = con.execute(
-                f"""SELECT id, content_hash, title, link, summary, category, score
+        rows = con.execute(
+            f"""SELECT id, content_hash, title, link, summary, category, score
+            FROM (
+                SELECT id, content_hash, title, link, summary, category, score,
+                       ROW_NUMBER() OVER (PARTITION BY category
+                                          ORDER BY score DESC) AS rn
                 FROM {config.T_ARTICLES}
-                WHERE status='pending' AND category=? AND score>?
-                ORDER BY score DESC LIMIT ?""",
-                (cat, min_score, top_n),
-            ).fetchall()
-            buckets[cat] = [dict(r) for r in rows]
+                WHERE status='pending' AND score>? AND category IN ({cat_placeholders})
+            )
+            WHERE rn <= ?
+            ORDER BY rn""",
+            (min_score, *priority_order, top_n),
+        ).fetchall()
+    for r in rows:
+        buckets[r["category"]].append(dict(r))
 
     selected, seen_ids = [], set()
 
@@ -354,12 +517,13 @@ def mark_articles_status(article_ids: List[int], status: str):
     if not article_ids:
         return
     placeholders = ",".join("?" * len(article_ids))
-    extra = f", published_at='{_now()}'" if status == "published" else ""
+    # Fully parameterized → same SQL text per batch size (statement cache hits)
     with _conn() as con:
         con.execute(
-            f"UPDATE {config.T_ARTICLES} SET status=?{extra} "
+            f"UPDATE {config.T_ARTICLES} SET status=?, "
+            f"published_at=CASE WHEN ?='published' THEN ? ELSE published_at END "
             f"WHERE id IN ({placeholders})",
-            [status] + article_ids,
+            [status, status, _now()] + list(article_ids),
         )
 
 def mark_articles_status_by_status(statuses: list, new_status: str):
@@ -381,6 +545,49 @@ def log_publish(article_id: int, platform: str,
         )
 
 
+def log_publish_many(rows: List[tuple]):
+    """
+    Batch form of log_publish — one executemany + one commit.
+    rows: (article_id, platform, platform_post_id, status, error_msg)
+    """
+    if not rows:
+        return
+    now = _now()
+    with _conn() as con:
+        con.executemany(
+            f"INSERT INTO {config.T_PUBLISH} "
+            "(article_id, platform, platform_post_id, status, error_msg, created_at) "
+            "VALUES (?,?,?,?,?,?)",
+            [(*row, now) for row in rows],
+        )
+
+
+# ── Feed cache ────────────────────────────────────────
+
+def get_feed_validators() -> Dict[str, tuple]:
+    """url → (etag, last_modified) from the last successful fetch."""
+    with _conn() as con:
+        rows = con.execute(
+            f"SELECT url, etag, modified FROM {config.T_FEED_CACHE}"
+        ).fetchall()
+    return {r["url"]: (r["etag"], r["modified"]) for r in rows}
+
+
+def save_feed_validators(validators: Dict[str, tuple]):
+    """Upsert url → (etag, last_modified) in one transaction."""
+    if not validators:
+        return
+    now = _now()
+    with _conn() as con:
+        con.executemany(
+            f"INSERT INTO {config.T_FEED_CACHE} (url, etag, modified, updated_at) "
+            "VALUES (?,?,?,?) ON CONFLICT(url) DO UPDATE SET "
+            "etag=excluded.etag, modified=excluded.modified, "
+            "updated_at=excluded.updated_at",
+            [(url, etag, mod, now) for url, (etag, mod) in validators.items()],
+        )
+
+
 # ── Approval queue ────────────────────────────────────
 
 def set_approval(article_id: int, tg_msg_id: int = 0):
@@ -413,26 +620,22 @@ def get_approval(article_id: int) -> str:
 # ── Stats ─────────────────────────────────────────────
 
 def get_stats() -> Dict:
+    total, by_status, by_cat = 0, defaultdict(int), defaultdict(int)
     with _conn() as con:
-        total = con.execute(
-            f"SELECT COUNT(*) as n FROM {config.T_ARTICLES}"
-        ).fetchone()["n"]
-        by_status = {}
-        for row in con.execute(
-            f"SELECT status, COUNT(*) as n FROM {config.T_ARTICLES} GROUP BY status"
-        ).fetchall():
-            by_status[row["status"]] = row["n"]
-        by_cat = {}
+        # One scan; totals per status / category are folded in Python
         for row in con.execute(
-            f"SELECT category, COUNT(*) as n FROM {config.T_ARTICLES} GROUP BY category"
+            f"SELECT status, category, COUNT(*) as n FROM {config.T_ARTICLES} "
+            f"GROUP BY status, category"
         ).fetchall():
-            by_cat[row["category"]] = row["n"]
+            total                    += row["n"]
+            by_status[row["status"]] += row["n"]
+            by_cat[row["category"]]  += row["n"]
         rotation = get_rotation()
     return {
         "instance":    config.INSTANCE_NAME,
         "total":       total,
-        "by_status":   by_status,
-        "by_category": by_cat,
+        "by_status":   dict(by_status),
+        "by_category": dict(by_cat),
         "rotation":    rotation,
     }
 
@@ -7,44 +7,78 @@ Edge cases:
 - Timeout / connection error  → returns None (caller uses dummy.jpg)
 - Corrupt / tiny response     → deleted, returns None
 - Already generated           → returns cached path (no re-download)
+- return_bytes=True           → returns (path, bytes) so callers skip re-reads
 """
 import hashlib
 import logging
 import re
+import tempfile
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
+try:
+    # Optional: xxh3 is much faster than md5 for short cache keys
+    import xxhash
+
+    def _cache_key(text: str) -> str:
+        return xxhash.xxh3_64_hexdigest(text.encode())[:10]
+except ImportError:
+    def _cache_key(text: str) -> str:
+        return hashlib.md5(text.encode()).hexdigest()[:10]
+
 log      = logging.getLogger("image_gen")
 _CFG     = config.IMAGE_GEN
 _SAVE    = Path(_CFG["save_dir"])
 _SAVE.mkdir(parents=True, exist_ok=True)
 _API_KEY = _CFG.get("api_key", "")  # POLLINATIONS_API_KEY
 
+_CHUNK   = 64 * 1024                # download stream chunk
+
+_SLUG_STRIP    = re.compile(r"[^\w\s-]")
+_SLUG_COLLAPSE = re.compile(r"[\s_-]+")
+
+# Keep-alive session — every call (and retry) hits the same Pollinations host.
+# Retries stay in generate(), not the transport.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=_CFG.get("max_concurrency", 8),
+    max_retries=Retry(total=0),
+))
 
-def generate(prompt: str, filename_hint: str = "") -> Optional[Path]:
+
+def generate(prompt: str, filename_hint: str = "", return_bytes: bool = False
+             ) -> Union[Optional[Path], Tuple[Optional[Path], Optional[bytes]]]:
     """
     Generate image. Returns local Path on success, None on failure.
+    With return_bytes=True returns (path, bytes) / (None, None) instead.
     Caches by prompt hash — same prompt never re-downloads.
     """
+    miss = (None, None) if return_bytes else None
     if not prompt:
-        return None
+        return miss
 
     safe = prompt[:500].replace("\n", " ").strip()
-    h    = hashlib.md5(safe.encode()).hexdigest()[:10]
+    h    = _cache_key(safe)
     stem = _slugify(filename_hint)[:40] if filename_hint else ""
     name = f"{stem}_{h}.jpg" if stem else f"{h}.jpg"
     out  = _SAVE / name
 
-    # Return cached
-    if out.exists() and out.stat().st_size > 5000:
+    # Return cached (one stat — also covers the exists() check)
+    try:
+        cached = out.stat().st_size > 5000
+    except FileNotFoundError:
+        cached = False
+    if cached:
         log.info(f"🖼️  Cached image: {out.name}")
-        return out
+        return (out, out.read_bytes()) if return_bytes else out
 
     url = _build_url(safe)
     headers = {}
@@ -55,29 +89,49 @@ def generate(prompt: str, filename_hint: str = "") -> Optional[Path]:
 
     for attempt in range(1, 3):
         try:
-            r = requests.get(
+            with _session.get(
                 url,
                 headers=headers if headers else None,
                 timeout=_CFG["timeout_sec"],
                 stream=True,
-            )
-
-            if r.status_code == 200:
-                out.write_bytes(r.content)
-                size = out.stat().st_size
-                if size < 5000:
-                    log.warning(f"⚠️  Image too small ({size}B) — likely error page")
-                    out.unlink(missing_ok=True)
-                    return None
-                log.info(f"✅ Image saved: {out.name} ({size // 1024}KB)")
-                return out
-
-            if r.status_code == 401:
-                log.warning("⚠️  Pollinations API key invalid — retrying without key")
-                headers = {}
-                continue
-
-            log.warning(f"Pollinations HTTP {r.status_code} attempt {attempt}")
+            ) as r:
+                if r.status_code == 200:
+                    # Stream to a per-call .part file (concurrent calls for the
+                    # same prompt never share one); only a complete image
+                    # becomes `out`, and a broken stream leaves nothing behind
+                    chunks = [] if return_bytes else None
+                    size   = 0
+                    part   = None
+                    try:
+                        with tempfile.NamedTemporaryFile(
+                            "wb", dir=_SAVE, prefix=f"{out.stem}.",
+                            suffix=".part", delete=False,
+                        ) as f:
+                            part = Path(f.name)
+                            for chunk in r.iter_content(_CHUNK):
+                                if chunk:
+                                    f.write(chunk)
+                                    size += len(chunk)
+                                    if chunks is not None:
+                                        chunks.append(chunk)
+                        if size < 5000:
+                            log.warning(f"⚠️  Image too small ({size}B) — likely error page")
+                            out.unlink(missing_ok=True)
+                            return miss
+                        part.replace(out)
+                        part = None
+                    finally:
+                        if part is not None:
+                            part.unlink(missing_ok=True)
+                    log.info(f"✅ Image saved: {out.name} ({size // 1024}KB)")
+                    return (out, b"".join(chunks)) if return_bytes else out
+
+                if r.status_code == 401:
+                    log.warning("⚠️  Pollinations API key invalid — retrying without key")
+                    headers = {}
+                    continue
+
+                log.warning(f"Pollinations HTTP {r.status_code} attempt {attempt}")
 
         except requests.exceptions.Timeout:
             log.warning(f"⏱️  Image timeout (attempt {attempt})")
@@ -91,7 +145,7 @@ def generate(prompt: str, filename_hint: str = "") -> Optional[Path]:
             time.sleep(4)
 
     log.warning("⚠️  Image generation failed — fallback to dummy.jpg")
-    return None
+    return miss
 
 
 def build_prompt(title: str, category: str = "", niche: str = "") -> str:
@@ -114,6 +168,6 @@ def _build_url(prompt: str) -> str:
 
 def _slugify(text: str) -> str:
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "_", text)
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_COLLAPSE.sub("_", text)
     return text[:50]
@@ -13,15 +13,15 @@ import os
 import sys
 import time
 import logging
+import heapq
 import argparse
 from typing import List, Dict
-from collections import defaultdict
+from functools import cached_property
+from itertools import cycle
+from collections import defaultdict, deque
 
 import config
 import db
-from parser import RSSParser
-from ai import AIEngine
-from poster import Poster
 
 # ── Logging ───────────────────────────────────────────
 logging.basicConfig(
@@ -39,10 +39,7 @@ log = logging.getLogger("main")
 
 def get_rotated_order() -> List[str]:
     """Return category list rotated by current run index."""
-    base = sorted(
-        [c for c in config.CATEGORY_ANCHORS if c != "NOISE"],
-        key=lambda x: config.CATEGORY_ANCHORS[x]["priority"],
-    )
+    base = list(config.CATEGORY_PRIORITY_ORDER)
     if not base:
         return base
 
@@ -58,11 +55,23 @@ def get_rotated_order() -> List[str]:
 # ── Pipeline ──────────────────────────────────────────
 
 class NewsPipeline:
+    # Stages are built on first use — --status / --reset-rotation never
+    # pay for feedparser, the embedding model or the platform clients.
+
+    @cached_property
+    def parser(self):
+        from parser import RSSParser
+        return RSSParser()
+
+    @cached_property
+    def ai(self):
+        from ai import AIEngine
+        return AIEngine()
 
-    def __init__(self):
-        self.parser = RSSParser()
-        self.ai     = AIEngine()
-        self.poster = Poster()
+    @cached_property
+    def poster(self):
+        from poster import Poster
+        return Poster()
 
     def run(self, limit: int = 4, live: bool = False,
             skip_noise: bool = True) -> Dict:
@@ -71,11 +80,13 @@ class NewsPipeline:
 
         # ── Step 1: Fetch ──────────────────────────────
         _step(1, "Fetching RSS feeds...")
-        raw = self.parser.parse_feeds(config.RSS_FEEDS)
+        raw = self.parser.parse_feeds(config.RSS_FEEDS, conditional=live)
         log.info(f"  ✅ {len(raw)} unique articles fetched")
 
         if not raw:
             log.warning("⚠️  No articles from feeds")
+            if live:
+                db.save_feed_validators(self.parser.validators)
             return _result([], t0)
 
         # ── Step 2: AI Classify ────────────────────────
@@ -89,6 +100,8 @@ class NewsPipeline:
             _step(3, "Saving to SQLite + ChromaDB...")
             saved = db.save_articles_batch(processed, skip_noise=skip_noise)
             log.info(f"  ✅ {saved} new articles saved")
+            # Only now — a crash above must not leave these feeds looking unchanged
+            db.save_feed_validators(self.parser.validators)
         else:
             _step(3, "Skipping DB save (not live)")
 
@@ -153,26 +166,28 @@ def _step(n: int, msg: str):
 
 
 def _show_top(articles: list, n: int = 10):
-    sorted_arts = sorted(articles, key=lambda x: x.get("score", 0), reverse=True)
-    print(f"\n  📈 Top {n} by score:")
-    for i, a in enumerate(sorted_arts[:n], 1):
-        print(
-            f"  {i:2d}. [{a.get('category','?'):10s}] "
-            f"{a.get('score',0):6.2f} "
-            f"({a.get('classification_method','?')[:8]}) "
-            f"{a.get('title','')[:90]}"
-        )
+    top   = heapq.nlargest(n, articles, key=lambda x: x.get("score", 0))
+    lines = [f"\n  📈 Top {n} by score:"]
+    lines += [
+        f"  {i:2d}. [{a.get('category','?'):10s}] "
+        f"{a.get('score',0):6.2f} "
+        f"({a.get('classification_method','?')[:8]}) "
+        f"{a.get('title','')[:90]}"
+        for i, a in enumerate(top, 1)
+    ]
+    print("\n".join(lines))
 
 
 def _show_selection(articles: list):
     if not articles:
         print("  ⚠️  No articles selected")
         return
-    print(f"\n  ✅ FINAL SELECTION ({len(articles)}):")
+    lines = [f"\n  ✅ FINAL SELECTION ({len(articles)}):"]
     for i, a in enumerate(articles, 1):
-        print(f"  {i}. [{a.get('category','?')}] {a.get('score',0):.1f} — {a.get('title','')[:80]}")
+        lines.append(f"  {i}. [{a.get('category','?')}] {a.get('score',0):.1f} — {a.get('title','')[:80]}")
         if a.get("link"):
-            print(f"      🔗 {a['link']}")
+            lines.append(f"      🔗 {a['link']}")
+    print("\n".join(lines))
 
 
 def _metrics(raw, processed, selected, duration, live):
@@ -201,40 +216,39 @@ def _simulate_selection(articles: list, limit: int,
         a for a in articles
         if a.get("category") != "NOISE" and a.get("score", 0) > 0
     ]
-    buckets: Dict[str, list] = defaultdict(list)
+    score  = lambda x: x.get("score", 0)
+    top_n  = config.PIPELINE["top_per_category"]
+    groups: Dict[str, list] = defaultdict(list)
     for a in candidates:
-        buckets[a.get("category", "GENERAL")].append(a)
-    for cat in buckets:
-        buckets[cat].sort(key=lambda x: x.get("score", 0), reverse=True)
-        buckets[cat] = buckets[cat][:config.PIPELINE["top_per_category"]]
+        groups[a.get("category", "GENERAL")].append(a)
+    buckets: Dict[str, deque] = defaultdict(deque)
+    for cat, lst in groups.items():
+        buckets[cat] = deque(heapq.nlargest(top_n, lst, key=score))
 
     selected, seen = [], set()
 
-    while len(selected) < limit and any(buckets.values()):
-        picked = False
-        for cat in priority_order:
-            if len(selected) >= limit:
+    # Round-robin over priority_order; stop after a full lap with no pick
+    n_cats, picked = len(priority_order), True
+    for i, cat in enumerate(cycle(priority_order)):
+        if i % n_cats == 0:
+            if not picked:
                 break
-            if buckets[cat]:
-                a = buckets[cat].pop(0)
-                h = a.get("content_hash", "")
-                if h not in seen:
-                    selected.append(a)
-                    seen.add(h)
-                    picked = True
-        if not picked:
+            picked = False
+        if len(selected) >= limit:
             break
+        dq = buckets[cat]
+        if dq:
+            a = dq.popleft()
+            h = a.get("content_hash", "")
+            if h not in seen:
+                selected.append(a)
+                seen.add(h)
+                picked = True
 
     if len(selected) < limit:
-        remaining = sorted(
-            [a for lst in buckets.values() for a in lst
-             if a.get("content_hash") not in seen],
-            key=lambda x: x.get("score", 0), reverse=True,
-        )
-        for a in remaining:
-            if len(selected) >= limit:
-                break
-            selected.append(a)
+        remaining = (a for dq in buckets.values() for a in dq
+                     if a.get("content_hash") not in seen)
+        selected.extend(heapq.nlargest(limit - len(selected), remaining, key=score))
 
     return selected
 
@@ -1,18 +1,47 @@
 """
 parser.py - RSS feed fetcher.
-Parallel fetching, deduplication by hash, age filtering.
+Parallel fetching (pooled keep-alive session), lxml fast path for plain
+RSS 2.0 / Atom with feedparser as the fallback, deduplication by hash,
+age filtering. Live runs send conditional GETs
+(ETag / Last-Modified stored in SQLite) and skip feeds that answer 304.
 """
 import re
 import hashlib
 import logging
 from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 
+import requests
+from requests.adapters import HTTPAdapter
+
 import config
+import db
+
+try:
+    # Optional: C XML parser for the common RSS 2.0 / Atom shapes
+    from lxml import etree as _etree
+except ImportError:
+    _etree = None
 
 log = logging.getLogger(__name__)
 
+# Script/style bodies go with their tags (feedparser's sanitizer drops them too)
+_TAG_RE     = re.compile(r"<(script|style)\b.*?</\1\s*>|<[^>]+>", re.I | re.S)
+_WS_RE      = re.compile(r"\s+")
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_ATOM       = "{http://www.w3.org/2005/Atom}"
+
+# Shared keep-alive session — feeds from the same host reuse TCP+TLS,
+# and every fetch gets a real timeout (feedparser.parse(url) has none)
+_session = requests.Session()
+_session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; NewsPipelineBot/1.0)"})
+_adapter = HTTPAdapter(pool_connections=16,
+                       pool_maxsize=config.PIPELINE["max_feed_workers"])
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 class RSSParser:
 
@@ -24,81 +53,157 @@ class RSSParser:
         except ImportError:
             log.error("❌ feedparser not installed — pip install feedparser")
             self._ok = False
+        self.validators: Dict[str, tuple] = {}
 
     # ── Public ────────────────────────────────────────
 
-    def parse_feeds(self, urls: List[str]) -> List[Dict]:
-        """Fetch all feeds in parallel, return unique articles."""
+    def parse_feeds(self, urls: List[str], conditional: bool = False) -> List[Dict]:
+        """
+        Fetch all feeds in parallel, return unique articles.
+        conditional=True (live runs) skips feeds unchanged since the last
+        conditional fetch. Dry runs always fetch everything and leave the
+        stored validators alone, so they never hide articles from a live run.
+        The new validators are left in self.validators; the caller stores
+        them (db.save_feed_validators) only once the articles are saved, so
+        a run that fails after fetching never turns their feeds into 304s.
+        """
+        self.validators = {}
         if not self._ok:
             return []
 
+        conditional = conditional and config.PIPELINE.get("conditional_fetch", True)
+        cache = db.get_feed_validators() if conditional else {}
+        fresh: Dict[str, tuple] = {}
+
         log.info(f"📡 Fetching {len(urls)} RSS feeds...")
-        all_articles: List[Dict] = []
+        seen, unique = set(), []
+        total = 0
 
         with ThreadPoolExecutor(max_workers=config.PIPELINE["max_feed_workers"]) as ex:
-            futures = {ex.submit(self._fetch, u): u for u in urls}
+            futures = {
+                ex.submit(self._fetch, u, cache.get(u), fresh if conditional else None): u
+                for u in urls
+            }
             for fut in as_completed(futures):
                 try:
-                    all_articles.extend(fut.result())
+                    arts = fut.result()
                 except Exception as e:
                     log.error(f"❌ Feed failed {futures[fut][:60]}: {e}")
+                    continue
+                total += len(arts)
+                # Dedup by content hash as results arrive — no second pass
+                for art in arts:
+                    h = art["content_hash"]
+                    if h not in seen:
+                        seen.add(h)
+                        unique.append(art)
 
-        # Dedup by content hash
-        seen, unique = set(), []
-        for art in all_articles:
-            h = art["content_hash"]
-            if h not in seen:
-                seen.add(h)
-                unique.append(art)
-
-        removed = len(all_articles) - len(unique)
+        removed = total - len(unique)
         if removed:
             log.info(f"🔍 Removed {removed} feed-level duplicates")
 
+        if conditional:
+            unchanged = sum(1 for u in urls if fresh.get(u) == ())
+            if unchanged:
+                log.info(f"⏭️  {unchanged} feeds unchanged since last run (304)")
+            self.validators = {u: v for u, v in fresh.items() if v}
+
         log.info(f"✅ {len(unique)} unique articles fetched")
         return unique
 
     # ── Private ───────────────────────────────────────
 
-    def _fetch(self, url: str) -> List[Dict]:
+    def _fetch(self, url: str, validators: tuple = None,
+               fresh: Dict[str, tuple] = None) -> List[Dict]:
+        """
+        validators: (etag, last_modified) sent as If-None-Match /
+        If-Modified-Since. fresh: filled with this response's validators
+        after a successful parse, or () on 304.
+        """
         try:
-            feed = self._fp.parse(url)
+            headers = {}
+            if validators:
+                etag, modified = validators
+                if etag:
+                    headers["If-None-Match"] = etag
+                if modified:
+                    headers["If-Modified-Since"] = modified
+            r = _session.get(url, headers=headers,
+                             timeout=config.PIPELINE.get("feed_timeout_sec", 15))
+            if r.status_code == 304:
+                if fresh is not None:
+                    fresh[url] = ()
+                log.debug("  ⏭️  unchanged ← %.60s", url)
+                return []
+            r.raise_for_status()
+            entries = self._parse_body(r.content, r.headers.get("Content-Type", ""))
             articles = []
             cutoff = datetime.now(timezone.utc) - timedelta(
                 hours=config.PIPELINE.get("max_age_hours", 48)
             )
 
-            for entry in feed.entries:
-                title   = entry.get("title", "No Title").strip()
-                link    = entry.get("link", "")
-                summary = self._clean_html(
-                    entry.get("summary", "") or entry.get("description", "")
-                )[:500]
-
-                # Age filter
-                pub = self._parse_date(entry)
+            for title, link, summary, pub in entries:
+                # Age filter first — skip the HTML clean for stale entries
                 if pub and pub < cutoff:
                     continue
 
                 articles.append({
-                    "title":        title,
+                    "title":        title.strip(),
                     "link":         link,
-                    "summary":      summary,
+                    "summary":      self._clean_html(summary),
                     "published_at": pub.isoformat() if pub else None,
-                    "content_hash": self._hash(title, link),
                     "source_feed":  url,
                 })
 
-            log.debug(f"  ✓ {len(articles)} articles ← {url[:60]}")
+            hashes = self._hash_many([(a["title"], a["link"]) for a in articles])
+            for art, h in zip(articles, hashes):
+                art["content_hash"] = h
+
+            if fresh is not None:
+                etag, modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+                if etag or modified:
+                    fresh[url] = (etag, modified)
+
+            log.debug("  ✓ %d articles ← %.60s", len(articles), url)
             return articles
 
         except Exception as e:
             log.error(f"❌ Parse error {url[:60]}: {e}")
             return []
 
+    def _parse_body(self, body: bytes, content_type: str) -> List[tuple]:
+        """(title, link, summary_html, published) per entry — lxml, else feedparser."""
+        if _etree is not None:
+            m = _CHARSET_RE.search(content_type)
+            if not m or m.group(1).lower() in ("utf-8", "utf8"):
+                try:
+                    entries = _parse_xml(body)
+                    if entries is not None:
+                        return entries
+                except Exception as e:
+                    log.debug("lxml fast path skipped: %s", e)
+
+        feed = self._fp.parse(body, response_headers={"content-type": content_type})
+        return [
+            (e.get("title", "No Title"),
+             e.get("link", ""),
+             e.get("summary", "") or e.get("description", ""),
+             self._parse_date(e))
+            for e in feed.entries
+        ]
+
     @staticmethod
     def _hash(title: str, link: str) -> str:
-        return hashlib.sha256(f"{title}{link}".encode()).hexdigest()
+        # Dedup key only — BLAKE2b-128 is faster than SHA-256 and half the length.
+        # NUL separator keeps ("ab", "c") and ("a", "bc") apart.
+        # db._migrate_hash_keys re-keys pre-BLAKE2b rows to this same key.
+        return hashlib.blake2b(f"{title}\x00{link}".encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _hash_many(pairs: List[tuple]) -> List[str]:
+        """_hash over a whole feed in one comprehension (same keys)."""
+        b2 = hashlib.blake2b
+        return [b2(f"{t}\x00{l}".encode(), digest_size=16).hexdigest() for t, l in pairs]
 
     @staticmethod
     def _parse_date(entry) -> datetime | None:
@@ -110,6 +215,62 @@ class RSSParser:
         return None
 
     @staticmethod
-    def _clean_html(text: str) -> str:
-        text = re.sub(r"<[^>]+>", "", text)
-        return " ".join(text.split())
+    def _clean_html(text: str, limit: int = 500) -> str:
+        return _WS_RE.sub(" ", _TAG_RE.sub("", text)).strip()[:limit]
+
+
+# ── lxml fast path ────────────────────────────────────
+
+def _parse_xml(body: bytes) -> List[tuple] | None:
+    """
+    Plain RSS 2.0 / Atom → same fields feedparser gives us. Returns None for
+    other shapes (RDF, namespaced RSS) and raises on malformed XML or a date
+    it can't read, so the caller falls back to feedparser for that feed.
+    """
+    parser = _etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+    root   = _etree.fromstring(body, parser=parser)
+
+    if root.tag == "rss":
+        out = []
+        for item in root.iterfind("channel/item"):
+            link = (item.findtext("link") or "").strip()
+            if not link:
+                guid = item.find("guid")
+                if guid is not None and guid.get("isPermaLink", "true") != "false":
+                    link = (guid.text or "").strip()
+            date = item.findtext("pubDate")
+            out.append((
+                item.findtext("title", "No Title").strip(),
+                link,
+                item.findtext("description") or "",
+                _utc(parsedate_to_datetime(date)) if date else None,
+            ))
+        return out
+
+    if root.tag == f"{_ATOM}feed":
+        out = []
+        for entry in root.iterfind(f"{_ATOM}entry"):
+            link = ""
+            for el in entry.iterfind(f"{_ATOM}link"):
+                if el.get("rel", "alternate") == "alternate":
+                    link = el.get("href", "")
+                    break
+            if entry.find(f"{_ATOM}*[@type='xhtml']") is not None:
+                raise ValueError("xhtml text construct")
+            date = entry.findtext(f"{_ATOM}published")
+            out.append((
+                entry.findtext(f"{_ATOM}title", "No Title").strip(),
+                link,
+                entry.findtext(f"{_ATOM}summary") or entry.findtext(f"{_ATOM}content") or "",
+                _utc(datetime.fromisoformat(date.strip())) if date else None,
+            ))
+        return out
+
+    return None
+
+
+def _utc(dt: datetime) -> datetime:
+    """Aware UTC, whole seconds — matches feedparser's published_parsed."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
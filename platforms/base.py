@@ -1,14 +1,20 @@
 """
 platforms/base.py - Abstract base for all posting platforms.
-Provides: retry with exponential backoff, rate limiting, dry-run guard.
+Provides: retry with exponential backoff, rate limiting, dry-run guard,
+and a keep-alive HTTP session per platform.
 This folder is self-contained — drop it into any project.
 """
 import time
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Optional
 from abc import ABC, abstractmethod
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 import config
 
 
@@ -32,6 +38,21 @@ class BasePlatform(ABC):
         self.log     = logging.getLogger(f"platform.{name}")
         self._limits = config.RATE_LIMITS.get(name, {})
         self._last_call_time: float = 0.0
+        self._rate_lock = threading.Lock()   # send() may run on several threads
+        # Mode flags and retry/rate settings are fixed for the platform's
+        # lifetime (platforms are built after the CLI sets TEST_MODE)
+        self._test_mode       = config.TEST_MODE
+        self._dry_run         = config.DRY_RUN
+        self._posting_enabled = not (self._test_mode or self._dry_run)
+        self._attempts        = self._limits.get("retry_attempts", 3)
+        self._backoff         = self._limits.get("backoff_base", 2.0)
+        self._min_gap         = 3600.0 / self._limits.get("requests_per_hour", 200)
+        # Keep-alive pool — retries are handled by send(), not urllib3
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                              max_retries=Retry(total=0))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     # ── Abstract interface ────────────────────────────
 
@@ -44,34 +65,36 @@ class BasePlatform(ABC):
         ...
 
     @abstractmethod
-    def post_image(self, text: str, image_path: str, link: str = "") -> PostResult:
+    def post_image(self, text: str, image_path: str, link: str = "",
+                   image_bytes: bytes = None) -> PostResult:
         ...
 
     # ── Shared helpers ────────────────────────────────
 
-    def send(self, text: str, image_path: str = "", link: str = "") -> PostResult:
+    def send(self, text: str, image_path: str = "", link: str = "",
+             image_bytes: Optional[bytes] = None) -> PostResult:
         """
         Public entry point. Handles dry-run and delegates to
         post_image (if image_path given) or post_text.
+        image_bytes, when given, is the already-loaded image at image_path.
         """
-        if config.TEST_MODE:
-            self.log.info(f"[TEST] Would post to {self.name}: {text[:80]}")
-            return PostResult(success=True, platform=self.name,
-                              platform_post_id="test_mode")
-
-        if config.DRY_RUN:
+        if not self._posting_enabled:
+            if self._test_mode:
+                self.log.info(f"[TEST] Would post to {self.name}: {text[:80]}")
+                return PostResult(success=True, platform=self.name,
+                                  platform_post_id="test_mode")
             self.log.info(f"[DRY RUN] {self.name}: {text[:80]}")
             return PostResult(success=True, platform=self.name,
                               platform_post_id="dry_run")
 
         self._rate_limit()
-        attempts = self._limits.get("retry_attempts", 3)
-        backoff  = self._limits.get("backoff_base", 2.0)
+        attempts, backoff = self._attempts, self._backoff
 
         for attempt in range(1, attempts + 1):
             try:
                 if image_path:
-                    result = self.post_image(text, image_path, link)
+                    result = self.post_image(text, image_path, link,
+                                             image_bytes=image_bytes)
                 else:
                     result = self.post_text(text, link)
 
@@ -91,10 +114,13 @@ class BasePlatform(ABC):
                           error_message="Max retries exceeded")
 
     def _rate_limit(self):
-        """Enforce minimum gap between calls based on requests_per_hour."""
-        rph = self._limits.get("requests_per_hour", 200)
-        min_gap = 3600.0 / rph
-        elapsed = time.time() - self._last_call_time
-        if elapsed < min_gap:
-            time.sleep(min_gap - elapsed)
-        self._last_call_time = time.time()
+        """
+        Enforce minimum gap between calls based on requests_per_hour.
+        Each caller reserves its slot under the lock, then sleeps outside it.
+        """
+        with self._rate_lock:
+            now  = time.time()
+            slot = max(now, self._last_call_time + self._min_gap)
+            self._last_call_time = slot
+        if slot > now:
+            time.sleep(slot - now)
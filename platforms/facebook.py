@@ -3,9 +3,16 @@ Facebook Page posting via Graph API.
 Posts text and images to your Facebook Page.
 """
 
+import os
 import requests
 from typing import Optional
 
+try:
+    # Optional: streams the photo from disk instead of buffering the whole file
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 import config
 from platforms.base import BasePlatform, PostResult
 
@@ -27,7 +34,7 @@ class FacebookPlatform(BasePlatform):
     def validate_credentials(self) -> bool:
         """Verify the access token is still valid."""
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.API_BASE}/me",
                 params={"access_token": self.access_token},
                 timeout=10,
@@ -63,7 +70,7 @@ class FacebookPlatform(BasePlatform):
                     platform_post_id="dry_run",
                 )
 
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.API_BASE}/{self.page_id}/feed",
                 data=payload,
                 timeout=30,
@@ -95,7 +102,8 @@ class FacebookPlatform(BasePlatform):
             )
 
     def post_image(
-        self, text: str, image_path: str, link: str = ""
+        self, text: str, image_path: str, link: str = "",
+        image_bytes: Optional[bytes] = None,
     ) -> PostResult:
         """Post a photo with caption to the Facebook Page."""
         try:
@@ -117,13 +125,27 @@ class FacebookPlatform(BasePlatform):
                     platform_post_id="dry_run",
                 )
 
-            with open(image_path, "rb") as img_file:
-                resp = requests.post(
-                    f"{self.API_BASE}/{self.page_id}/photos",
-                    data=payload,
-                    files={"source": img_file},
+            url = f"{self.API_BASE}/{self.page_id}/photos"
+            if image_bytes is not None:
+                resp = self._session.post(
+                    url, data=payload,
+                    files={"source": ("image.jpg", image_bytes, "image/jpeg")},
                     timeout=60,
                 )
+            else:
+                with open(image_path, "rb") as img_file:
+                    source = (os.path.basename(image_path), img_file, "image/jpeg")
+                    if MultipartEncoder is not None:
+                        body = MultipartEncoder(fields={**payload, "source": source})
+                        resp = self._session.post(
+                            url, data=body,
+                            headers={"Content-Type": body.content_type},
+                            timeout=60,
+                        )
+                    else:
+                        resp = self._session.post(
+                            url, data=payload, files={"source": source}, timeout=60,
+                        )
 
             data = resp.json()
 
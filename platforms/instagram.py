@@ -1,11 +1,10 @@
 """
 platforms/instagram.py - Instagram Business via Graph API.
-Flow: Create container → wait → Publish container.
+Flow: Create container → poll status → Publish container.
 Requires: INSTAGRAM_ACCOUNT_ID + INSTAGRAM_ACCESS_TOKEN (same Facebook token works).
 Image must be a public URL. We upload dummy image to FB CDN or use image_url param.
 """
 import time
-import requests
 from platforms.base import BasePlatform, PostResult
 import config
 
@@ -20,7 +19,7 @@ class InstagramPlatform(BasePlatform):
 
     def validate_credentials(self) -> bool:
         try:
-            r = requests.get(
+            r = self._session.get(
                 f"{self.API}/{self.account_id}",
                 params={"fields": "name,username", "access_token": self.token},
                 timeout=10,
@@ -41,7 +40,8 @@ class InstagramPlatform(BasePlatform):
         return PostResult(False, "instagram",
                           error_message="Instagram requires image")
 
-    def post_image(self, text: str, image_path: str, link: str = "") -> PostResult:
+    def post_image(self, text: str, image_path: str, link: str = "",
+                   image_bytes: bytes = None) -> PostResult:
         """
         Instagram requires a PUBLIC image URL.
         If image_path is a local file, we need to serve it publicly.
@@ -60,7 +60,7 @@ class InstagramPlatform(BasePlatform):
 
         try:
             # Step 1: Create media container
-            r = requests.post(
+            r = self._session.post(
                 f"{self.API}/{self.account_id}/media",
                 data={
                     "image_url":  image_url,
@@ -75,11 +75,14 @@ class InstagramPlatform(BasePlatform):
                                   error_message=data["error"]["message"])
             container_id = data.get("id")
 
-            # Step 2: Wait for container to process (usually < 3s)
-            time.sleep(3)
+            # Step 2: Poll until the container is ready (usually < 1s, cap 5s)
+            status = self._wait_for_container(container_id)
+            if status == "ERROR":
+                return PostResult(False, "instagram",
+                                  error_message="Instagram container processing failed")
 
             # Step 3: Publish
-            r2 = requests.post(
+            r2 = self._session.post(
                 f"{self.API}/{self.account_id}/media_publish",
                 data={"creation_id": container_id, "access_token": self.token},
                 timeout=30,
@@ -95,3 +98,22 @@ class InstagramPlatform(BasePlatform):
 
         except Exception as e:
             return PostResult(False, "instagram", error_message=str(e))
+
+    def _wait_for_container(self, container_id: str,
+                            timeout: float = 5.0, interval: float = 0.3) -> str:
+        """Poll the container's status_code; return the last status seen."""
+        status   = ""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                r = self._session.get(
+                    f"{self.API}/{container_id}",
+                    params={"fields": "status_code", "access_token": self.token},
+                    timeout=5,
+                )
+                status = r.json().get("status_code", "")
+            except Exception as e:
+                self.log.debug("Instagram status poll failed: %s", e)
+            if status in ("FINISHED", "ERROR") or time.monotonic() >= deadline:
+                return status
+            time.sleep(interval)
@@ -311,7 +311,7 @@ class TelegramApproval:
             elapsed += sleep_for
             remaining = total - elapsed
             if remaining > 0:
-                log.debug(f"   ...{remaining:.0f}s remaining")
+                log.debug("   ...%.0fs remaining", remaining)
 
 
 # ── Caption / keyboard builders ───────────────────────
@@ -366,7 +366,8 @@ class TelegramPlatform(BasePlatform):
                               platform_post_id=str(msg.get("message_id", "")))
         return PostResult(False, "telegram", error_message="Send failed")
 
-    def post_image(self, text: str, image_path: str, link: str = "") -> PostResult:
+    def post_image(self, text: str, image_path: str, link: str = "",
+                   image_bytes: bytes = None) -> PostResult:
         if not self._bot.is_usable:
             return PostResult(False, "telegram", error_message="Telegram not configured")
         caption = f"{text}\n\n🔗 {link}" if link else text
@@ -86,7 +86,8 @@ class TwitterPlatform(BasePlatform):
         except Exception as e:
             return PostResult(False, "twitter", error_message=str(e))
 
-    def post_image(self, text: str, image_path: str, link: str = "") -> PostResult:
+    def post_image(self, text: str, image_path: str, link: str = "",
+                   image_bytes: bytes = None) -> PostResult:
         """Twitter media upload requires v1.1 endpoint — simplified to text+link."""
         self.log.info("ℹ️  Twitter: image upload skipped, posting text+link only")
         return self.post_text(text, link)
@@ -80,7 +80,8 @@ class YouTubePlatform(BasePlatform):
         except Exception as e:
             return PostResult(False, "youtube", error_message=str(e))
 
-    def post_image(self, text: str, image_path: str, link: str = "") -> PostResult:
+    def post_image(self, text: str, image_path: str, link: str = "",
+                   image_bytes: bytes = None) -> PostResult:
         """
         YouTube doesn't support image posts — fallback to text community post.
         If you want YouTube Shorts, provide a video_path instead (see post_video).
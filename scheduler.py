@@ -117,6 +117,7 @@ def run_service():
     import signal
 
     config.print_status()
+    config.warm()                   # build regexes/sections now, not on the first run
     db.init_db()
 
     sched = Scheduler()
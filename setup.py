@@ -91,7 +91,6 @@ def check_imports():
         ("sentence_transformers", "sentence-transformers",  True,  "Local AI embeddings"),
         ("chromadb",              "chromadb",               True,  "Vector DB (same-day dedup)"),
         ("requests",              "requests",               True,  "HTTP client"),
-        ("dotenv",                "python-dotenv",          True,  ".env loading"),
         ("PIL",                   "Pillow",                 True,  "Dummy image creation"),
         ("bs4",                   "beautifulsoup4",         True,  "Blog content fetching"),
         ("lxml",                  "lxml",                   False, "Faster HTML parser (optional)"),
@@ -21,6 +21,13 @@ def isolate_db(tmp_path, monkeypatch):
     monkeypatch.setattr("config.DB_PATH", tmp_path / "test.db")
     monkeypatch.setattr("config.CHROMA_DIR", tmp_path / "chroma")
     monkeypatch.setattr("config.TEST_MODE", True)
+    import config
+    monkeypatch.setattr("config.LOCAL_AI_CONFIG", {
+        **config.LOCAL_AI_CONFIG,
+        "embedding_cache":   str(tmp_path / "emb_cache.db"),
+        "anchor_cache_path": str(tmp_path / "anchors.npz"),
+        "hs_cache_path":     str(tmp_path / "fallback_hs.db"),
+    })
     import db
     db.init_db()
     yield
@@ -63,6 +70,85 @@ class TestParser:
         h2 = RSSParser._hash("title b", "http://b.com")
         assert h1 != h2
 
+    def test_hash_many_matches_hash(self):
+        from parser import RSSParser
+        pairs = [("title a", "http://a.com"), ("ab", "c"), ("a", "bc")]
+        hashes = RSSParser._hash_many(pairs)
+        assert hashes == [RSSParser._hash(t, l) for t, l in pairs]
+        assert hashes[1] != hashes[2]
+
+    def test_lxml_fast_path_matches_feedparser(self, monkeypatch):
+        pytest.importorskip("lxml")
+        import parser as feed_parser
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            '<item><title> रेपो दर &amp; RBI </title><guid>http://x/1</guid>'
+            '<description>&lt;b&gt;Big&lt;/b&gt; news</description>'
+            '<pubDate>Tue, 02 Jan 2024 03:04:05 +0530</pubDate></item>'
+            '<item><title>No date</title><link>http://x/2</link></item>'
+            '</channel></rss>'
+        ).encode()
+        p = feed_parser.RSSParser()
+        assert feed_parser._parse_xml(body) is not None
+        fast = p._parse_body(body, "application/rss+xml")
+        monkeypatch.setattr(feed_parser, "_etree", None)
+        assert fast == p._parse_body(body, "application/rss+xml")
+
+    def test_validators_saved_only_after_articles(self, monkeypatch):
+        import config
+        import db
+        import parser as feed_parser
+        from main import NewsPipeline
+
+        body = (b'<?xml version="1.0"?><rss version="2.0"><channel>'
+                b'<item><title>RBI holds repo rate</title>'
+                b'<link>http://x/1</link></item></channel></rss>')
+
+        class Resp:
+            def __init__(self, status):
+                self.status_code, self.content = status, body
+                self.headers = {"ETag": '"v1"', "Content-Type": "application/rss+xml"}
+
+            def raise_for_status(self):
+                pass
+
+        def get(url, headers=None, timeout=None):
+            return Resp(304 if (headers or {}).get("If-None-Match") == '"v1"' else 200)
+
+        class BrokenAI:
+            def process_articles(self, arts):
+                raise RuntimeError("classifier down")
+
+        class AI:
+            def process_articles(self, arts):
+                return [{**a, "category": "FINANCE", "score": 10.0,
+                         "embedding": None} for a in arts]
+
+        class Poster:
+            def start(self):
+                pass
+
+            def post_articles(self, arts):
+                return {}
+
+        monkeypatch.setattr(feed_parser._session, "get", get)
+        monkeypatch.setattr(config, "RSS_FEEDS", ["http://a/rss"])
+
+        # Run 1 dies after fetching → nothing saved, validators not stored
+        pipe = NewsPipeline()
+        pipe.ai = BrokenAI()
+        with pytest.raises(RuntimeError):
+            pipe.run(live=True)
+        assert db.get_feed_validators() == {}
+
+        # Run 2 must still get the body, not a 304
+        pipe = NewsPipeline()
+        pipe.ai, pipe.poster = AI(), Poster()
+        pipe.run(live=True)
+        assert db.get_recent_posts()[0]["title"] == "RBI holds repo rate"
+        assert db.get_feed_validators() == {"http://a/rss": ('"v1"', None)}
+        assert pipe.parser.parse_feeds(config.RSS_FEEDS, conditional=True) == []
+
 
 # ── AI Engine tests ───────────────────────────────────
 
@@ -94,6 +180,341 @@ class TestRegexClassifier:
         assert conf < 0.5
 
 
+class TestEmbeddingClassifier:
+    def _engine(self):
+        import numpy as np
+        import config
+        from ai import AIEngine
+        eng = AIEngine()
+        cats = list(config.CATEGORY_NAMES)
+        eng._anchor_cats   = cats
+        eng._anchor_matrix = np.eye(len(cats), dtype=np.float32)
+        eng._weights       = config.CATEGORY_WEIGHTS
+        return eng, cats
+
+    def test_batched_argmax(self):
+        import numpy as np
+        import config
+        eng, cats = self._engine()
+        emb = np.zeros((2, len(cats)), dtype=np.float32)
+        emb[0, cats.index("FINANCE")] = 1.0
+        emb[1, cats.index("ALERTS")]  = 1.0
+        results = eng._classify_by_embedding(emb)
+        assert [r[0] for r in results] == ["FINANCE", "ALERTS"]
+        expected = 10.0 + config.CATEGORY_ANCHORS["FINANCE"]["weight"]
+        assert results[0][1] == pytest.approx(expected)
+        assert results[0][2] == "embedding"
+        assert results[0][3] == pytest.approx(1.0)   # runner-up sim is 0
+
+    def test_noise_scored_negative(self):
+        import numpy as np
+        eng, cats = self._engine()
+        emb = np.zeros((1, len(cats)), dtype=np.float32)
+        emb[0, cats.index("NOISE")] = 1.0
+        cat, score, _, _ = eng._classify_by_embedding(emb)[0]
+        assert cat == "NOISE"
+        assert score == -50.0
+
+
+class TestLocalEmbedding:
+    def test_length_buckets_cover_all_indices(self):
+        from ai import LocalEmbedding
+        texts = ["short title", "word " * 40, "word " * 100, "a b c", "word " * 20]
+        buckets = LocalEmbedding._buckets(texts)
+        idxs = [i for g, _ in buckets for i in g]
+        assert sorted(idxs) == list(range(len(texts)))
+        # Short texts land in an earlier (wider-batch) bucket than long ones
+        assert 0 in buckets[0][0] and 2 in buckets[-1][0]
+
+    def test_embedding_cache_roundtrip(self, tmp_path):
+        import numpy as np
+        from ai import _EmbeddingCache
+        cache = _EmbeddingCache(tmp_path / "emb.db")
+        keys = [cache.key("a"), cache.key("b")]
+        vecs = np.array([[1, 0, 0], [0, 1, 0]], dtype=np.float32)
+        cache.put_many("m", keys, vecs)
+        hits = cache.get_many("m", keys + [cache.key("c")])
+        assert set(hits) == set(keys)
+        assert np.array_equal(hits[keys[1]], vecs[1])
+        assert cache.get_many("other-model", keys) == {}
+
+
+class TestConfig:
+    def test_load_env(self, tmp_path, monkeypatch):
+        from config import _load_env
+        env = tmp_path / ".env"
+        env.write_text(
+            "# comment\n"
+            "T_PLAIN=1        # inline comment\n"
+            "export T_QUOTED=\"a # b\"\n"
+            "T_DUP=first\nT_DUP=second\n"
+            "T_SET=from_file\n"
+        )
+        for k in ("T_PLAIN", "T_QUOTED", "T_DUP"):
+            monkeypatch.delenv(k, raising=False)
+        monkeypatch.setenv("T_SET", "from_env")
+        _load_env(env)
+        assert os.environ["T_PLAIN"] == "1"
+        assert os.environ["T_QUOTED"] == "a # b"
+        assert os.environ["T_DUP"] == "second"
+        assert os.environ["T_SET"] == "from_env"   # real env wins
+        for k in ("T_PLAIN", "T_QUOTED", "T_DUP"):
+            monkeypatch.delenv(k)
+
+
+class TestAIWriterParse:
+    def test_fenced_json(self):
+        from ai_writer import _parse_response
+        assert _parse_response('```json\n{"title": "x"}\n```') == {"title": "x"}
+
+    def test_json_with_surrounding_chatter(self):
+        from ai_writer import _parse_response
+        raw = 'Sure! {"title": "a {b}", "body_html": "<p>\\"}\\"</p>"} Hope this helps {:)}'
+        data = _parse_response(raw)
+        assert data["title"] == "a {b}"
+        assert data["body_html"] == '<p>"}"</p>'
+
+    def test_unparseable(self):
+        from ai_writer import _parse_response
+        assert _parse_response("no json here") is None
+
+
+# ── Content fetcher tests ─────────────────────────────
+
+class TestContentFetcher:
+    HTML = ("<html><head><title>RBI</title></head><body><article><p>"
+            + "The Reserve Bank kept the repo rate unchanged this quarter. " * 5
+            + "</p></article></body></html>")
+
+    @pytest.fixture
+    def cf(self, tmp_path, monkeypatch):
+        import content_fetcher
+        monkeypatch.setattr(content_fetcher, "_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(content_fetcher, "_MEMO", {})
+        monkeypatch.setattr(content_fetcher, "_cache_pruned_at", None)
+        return content_fetcher
+
+    def _stub_get(self, cf, monkeypatch, responses, seen):
+        html = self.HTML
+
+        class Resp:
+            def __init__(self, status, headers):
+                self.status_code, self.headers = status, headers
+                self.text, self.encoding = html, "utf-8"
+
+        def get(url, headers=None, **kw):
+            seen.append(headers)
+            return Resp(*responses.pop(0))
+
+        monkeypatch.setattr(cf._session, "get", get)
+
+    def test_conditional_get_reuses_cache_on_304(self, cf, monkeypatch):
+        import os
+        url, seen = "https://example.com/a", []
+        self._stub_get(cf, monkeypatch,
+                       [(200, {"ETag": '"e1"'}), (304, {})], seen)
+
+        first = cf.fetch(url)
+        assert first.source == "fetch" and "repo rate" in first.content
+        assert seen[0] is None                              # nothing to revalidate yet
+        path = cf._cache_path(url)
+        os.utime(path, (0, 0))
+
+        cf._MEMO.clear()                                    # force a second request
+        second = cf.fetch(url)
+        assert seen[1] == {"If-None-Match": '"e1"'}
+        assert second.content == first.content
+        assert path.stat().st_mtime > 0                     # 304 touched the entry
+
+    def test_no_validator_no_cache_entry(self, cf, monkeypatch):
+        self._stub_get(cf, monkeypatch, [(200, {})], [])
+        assert cf.fetch("https://example.com/b").ok
+        assert not cf._cache_path("https://example.com/b").exists()
+
+    def test_prune_by_age_and_count(self, cf, monkeypatch):
+        import os
+        import time
+        import config
+        monkeypatch.setitem(config.BLOG_CONFIG, "content_cache_max_age_days", 1)
+        monkeypatch.setitem(config.BLOG_CONFIG, "content_cache_max_entries", 2)
+        cf._CACHE_DIR.mkdir(parents=True)
+        now = time.time()
+        ages = {"old": 3 * 86400, "a": 30, "b": 20, "c": 10}  # seconds ago
+        for name, age in ages.items():
+            p = cf._CACHE_DIR / f"{name}.json"
+            p.write_text("{}")
+            os.utime(p, (now - age, now - age))
+
+        cf._cache_maybe_prune()
+        assert sorted(p.stem for p in cf._CACHE_DIR.iterdir()) == ["b", "c"]
+
+        # Throttled: a second sweep within the hour does nothing
+        (cf._CACHE_DIR / "d.json").write_text("{}")
+        cf._cache_maybe_prune()
+        assert len(list(cf._CACHE_DIR.iterdir())) == 3
+
+    def test_memo_ttl_and_eviction(self, cf, monkeypatch):
+        import config
+        r = cf.FetchResult("u", content="x" * 60)
+        cf._memo_put("u", r)
+        assert cf._memo_get("u") is r
+        monkeypatch.setitem(config.BLOG_CONFIG, "fetch_memo_ttl_sec", 0)
+        assert cf._memo_get("u") is None                    # expired
+
+        monkeypatch.setattr(cf, "_MEMO_MAX", 2)
+        for u in ("u1", "u2", "u3"):
+            cf._memo_put(u, r)
+        assert list(cf._MEMO) == ["u2", "u3"]               # oldest evicted
+        cf._memo_put("u2", r)                               # re-put moves to newest
+        assert list(cf._MEMO) == ["u3", "u2"]
+
+
+class TestImageGen:
+    def _stub_get(self, monkeypatch, chunks):
+        import image_gen
+
+        class Resp:
+            status_code = 200
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def iter_content(self, size):
+                for c in chunks:
+                    if isinstance(c, Exception):
+                        raise c
+                    yield c
+
+        monkeypatch.setattr(image_gen._session, "get", lambda *a, **kw: Resp())
+
+    def test_stream_saved_without_part_left(self, tmp_path, monkeypatch):
+        import image_gen
+        save = tmp_path / "media"
+        save.mkdir()
+        monkeypatch.setattr(image_gen, "_SAVE", save)
+        self._stub_get(monkeypatch, [b"x" * 4000, b"y" * 4000])
+        path, data = image_gen.generate("a prompt", "Hint", return_bytes=True)
+        assert path.read_bytes() == data and len(data) == 8000
+        assert [p.name for p in save.iterdir()] == [path.name]
+
+    def test_broken_stream_removes_part(self, tmp_path, monkeypatch):
+        import requests
+        import image_gen
+        save = tmp_path / "media"
+        save.mkdir()
+        monkeypatch.setattr(image_gen, "_SAVE", save)
+        self._stub_get(monkeypatch, [b"x" * 4000,
+                                     requests.exceptions.ChunkedEncodingError("cut")])
+        assert image_gen.generate("a prompt", "Hint") is None
+        assert list(save.iterdir()) == []
+
+
+# ── Blog pipeline tests ───────────────────────────────
+
+class TestBlogger:
+    class FakeTG:
+        """Telegram stand-in: preview 2 crashes, callbacks approve 0 / skip 1."""
+        usable = True
+
+        def __init__(self):
+            self.sent, self.polls = [], 0
+
+        def send(self, caption, image_path, keyboard_json, image_bytes=None):
+            if "Story 2" in caption:
+                raise RuntimeError("socket closed")
+            self.sent.append(caption)
+            return 100 + len(self.sent)
+
+        def get_updates(self, wait=50):
+            self.polls += 1
+            return [
+                {"callback_query": {"id": "a", "data": "blog_approve:0:10"}},
+                {"callback_query": {"id": "b", "data": "blog_skip:1:11"}},
+                {"callback_query": {"id": "c", "data": "blog_skip:9:99"}},  # stale
+            ]
+
+        def answer_cb(self, cb_id, text=""):
+            pass
+
+        def remove_keyboard(self, msg_id):
+            pass
+
+        def plain(self, text):
+            pass
+
+    def test_decisions_auto_approve_and_publish_count(self, monkeypatch):
+        import threading
+        import config
+        import blogger
+        from ai_writer import BlogPost
+        from content_fetcher import FetchResult
+
+        def fetch(url, fallback_summary=""):
+            if url.endswith("/3"):
+                return FetchResult(url, source="failed")    # prepare fails
+            return FetchResult(url, content="body text " * 20)
+
+        def generate(article_title, source_content, source_url):
+            return BlogPost(title=article_title, body_html="<p>x</p>",
+                            tags=["rbi"], category_hint="Finance")
+
+        created, lock = [], threading.Lock()
+
+        def create_post(title, **kw):
+            with lock:
+                created.append(title)
+            return {"id": len(created), "link": f"https://blog/{title}"}
+
+        monkeypatch.setattr(config, "BLOG_ENABLED", True)
+        monkeypatch.setattr(config, "AUTO_APPROVE", False)
+        monkeypatch.setattr(config, "ENABLED_PLATFORM_SET", frozenset())
+        monkeypatch.setitem(config.BLOG_CONFIG, "approval_timeout_sec", 2)
+        monkeypatch.setattr(blogger, "fetch_content", fetch)
+        monkeypatch.setattr(blogger, "ai_generate", generate)
+        monkeypatch.setattr(blogger, "gen_image",
+                            lambda prompt, filename_hint="", return_bytes=False: (None, None))
+        monkeypatch.setattr(blogger.wp_client, "create_post", create_post)
+        monkeypatch.setattr(blogger.wp_client, "upload_image",
+                            lambda path, image_bytes=None: 7)
+        monkeypatch.setattr(blogger.wp_client, "get_or_create_category",
+                            lambda name: 3)
+
+        b = blogger.Blogger()
+        b._tg = self.FakeTG()
+        articles = [{"id": 10 + i, "title": f"Story {i}",
+                     "link": f"https://example.com/{i}", "summary": ""}
+                    for i in range(4)]
+        summary = b.run(articles)
+
+        assert summary == {"generated": 3, "approved": 2, "published": 2,
+                           "skipped": 1, "errors": 1}
+        assert sorted(created) == ["Story 0", "Story 2"]   # 2 = send crashed → auto
+        assert len(b._tg.sent) == 2
+        assert b._tg.polls == 1                            # stops once all decided
+
+    def test_category_lookup_once_per_name_in_parallel(self, monkeypatch):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        import blogger
+
+        calls, both_in = [], threading.Barrier(2, timeout=5)
+
+        def lookup(name):
+            calls.append(name)
+            both_in.wait()           # "News" and "Tech" must be in flight together
+            return f"id-{name.lower()}"
+
+        monkeypatch.setattr(blogger.wp_client, "get_or_create_category", lookup)
+        b = blogger.Blogger()
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            ids = list(ex.map(b._resolve_category, ["News", "Tech", "news", "NEWS"]))
+        assert ids == ["id-news", "id-tech", "id-news", "id-news"]
+        assert sorted(c.lower() for c in calls) == ["news", "tech"]
+
+
 # ── DB tests ──────────────────────────────────────────
 
 class TestDatabase:
@@ -116,6 +537,28 @@ class TestDatabase:
         saved_again = db.save_articles_batch(art)
         assert saved_again == 0
 
+    def test_legacy_sha256_rows_rekeyed_on_init(self):
+        import hashlib
+        import db
+        from parser import RSSParser
+        art = {**SAMPLE_ARTICLES[2], "category": "FINANCE", "score": 10.0, "embedding": None}
+        old_key = hashlib.sha256(f"{art['title']}{art['link']}".encode()).hexdigest()
+        assert db.save_articles_batch([{**art, "content_hash": old_key}]) == 1
+        with db._conn() as con:
+            con.execute("PRAGMA user_version = 0")       # as an unmigrated DB
+        db.init_db()
+        new_key = RSSParser._hash(art["title"], art["link"])
+        assert db.check_hash_exists([old_key, new_key]) == {new_key}
+        assert db.save_articles_batch([{**art, "content_hash": new_key}]) == 0
+
+    def test_hash_exists_large_batch(self):
+        import db
+        arts = [{**SAMPLE_ARTICLE, "content_hash": f"big_{i}", "category": "FINANCE",
+                 "score": 1.0, "embedding": None} for i in range(150)]
+        db.save_articles_batch(arts[:60])
+        probe = [a["content_hash"] for a in arts] + ["missing"]
+        assert db.check_hash_exists(probe) == {f"big_{i}" for i in range(60)}
+
     def test_noise_filtered(self):
         import db
         noisy = [{**SAMPLE_ARTICLES[1], "category": "NOISE",
@@ -140,6 +583,51 @@ class TestDatabase:
         assert state["last_index"] == 0
         assert state["run_count"] == 0
 
+    def test_log_publish_many(self):
+        import db
+        import config
+        db.log_publish_many([
+            (1, "wordpress", "11", "published", ""),
+            (2, "wordpress", "",   "skipped",   ""),
+        ])
+        with db._conn() as con:
+            rows = con.execute(
+                f"SELECT article_id, status FROM {config.T_PUBLISH} ORDER BY article_id"
+            ).fetchall()
+        assert [tuple(r) for r in rows] == [(1, "published"), (2, "skipped")]
+
+    def test_blog_record_logs_failures_with_error(self, monkeypatch):
+        import config
+        import db
+        from blogger import Blogger, BlogJob
+        jobs = [
+            BlogJob(article={"id": 1}, decision="approved", wp_post_id=11,
+                    wp_url="https://blog/1"),
+            BlogJob(article={"id": 2}, decision="approved", error="HTTP 500"),
+            BlogJob(article={"id": 3}, decision="skipped"),
+        ]
+
+        Blogger._record(jobs)                       # TEST_MODE → no rows
+        with db._conn() as con:
+            assert con.execute(f"SELECT COUNT(*) FROM {config.T_PUBLISH}").fetchone()[0] == 0
+
+        monkeypatch.setattr(config, "TEST_MODE", False)
+        Blogger._record(jobs)
+        with db._conn() as con:
+            rows = con.execute(
+                f"SELECT article_id, status, error_msg FROM {config.T_PUBLISH} "
+                "ORDER BY article_id"
+            ).fetchall()
+        assert [tuple(r) for r in rows] == [(1, "published", ""), (2, "failed", "HTTP 500")]
+
+    def test_feed_validators_upsert(self):
+        import db
+        db.save_feed_validators({"http://a/rss": ('"v1"', None)})
+        db.save_feed_validators({"http://a/rss": ('"v2"', "Mon, 01 Jan 2024 00:00:00 GMT")})
+        assert db.get_feed_validators() == {
+            "http://a/rss": ('"v2"', "Mon, 01 Jan 2024 00:00:00 GMT")
+        }
+
     def test_stats(self):
         import db
         stats = db.get_stats()
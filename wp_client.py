@@ -188,29 +188,31 @@ def _resolve_tags(names: list) -> list:
 
 # ── Media upload (REST — GraphQL doesn't support binary) ──
 
-def upload_image(image_path) -> Optional[str]:
+def upload_image(image_path, image_bytes: Optional[bytes] = None) -> Optional[str]:
     """
     Upload image via REST API. Returns global GraphQL media ID or None.
     Post continues without featured image if this fails.
+    Pass image_bytes to skip re-reading a file already held in memory.
     """
     if not image_path:
         return None
 
     path = Path(image_path)
-    if not path.exists():
+    if image_bytes is None and not path.exists():
         log.warning(f"⚠️  Image not found: {path}")
         return None
 
     mime = mimetypes.guess_type(str(path))[0] or "image/jpeg"
     try:
-        with open(path, "rb") as f:
-            result = _rest("post", "media",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{path.name}"',
-                    "Content-Type": mime,
-                },
-                data=f.read(),
-            )
+        if image_bytes is None:
+            image_bytes = path.read_bytes()
+        result = _rest("post", "media",
+            headers={
+                "Content-Disposition": f'attachment; filename="{path.name}"',
+                "Content-Type": mime,
+            },
+            data=image_bytes,
+        )
         if result and result.get("id"):
             # Convert REST integer ID → GraphQL global ID format
             db_id    = result["id"]